@@ -99,7 +99,10 @@ def read_xlsx(
 
 
 def read_pptx(
-    file_like: io.BytesIO, path: str | None = None
+    file_like: io.BytesIO,
+    path: str | None = None,
+    *,
+    slide_workers: int = 1,
 ) -> Generator[PptxContent, Any, None]:
     """Extract content from a PPTX file."""
     from sharepoint2text.parsing.extractors.ms_modern.pptx_extractor import (
@@ -107,7 +110,7 @@ def read_pptx(
     )
 
     logger.debug("Reading MS pptx file: %s", path)
-    return _read_pptx(file_like, path)
+    return _read_pptx(file_like, path, slide_workers=slide_workers)
 
 
 #############
@@ -249,7 +252,12 @@ def read_plain_text(
 # PDF
 #############
 def read_pdf(
-    file_like: io.BytesIO, path: str | None = None
+    file_like: io.BytesIO,
+    path: str | None = None,
+    *,
+    page_workers: int = 1,
+    extract_text: bool = True,
+    extract_images: bool = True,
 ) -> Generator[PdfContent, Any, None]:
     """Extract content from a PDF file."""
     from sharepoint2text.parsing.extractors.pdf.pdf_extractor import (
@@ -257,7 +265,13 @@ def read_pdf(
     )
 
     logger.debug("Reading PDF file: %s", path)
-    return _read_pdf(file_like, path)
+    return _read_pdf(
+        file_like,
+        path,
+        page_workers=page_workers,
+        extract_text=extract_text,
+        extract_images=extract_images,
+    )
 
 
 #############
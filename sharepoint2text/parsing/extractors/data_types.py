@@ -7,7 +7,7 @@ import typing
 from abc import abstractmethod
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Protocol
+from typing import Callable, Dict, List, Optional, Protocol
 
 from sharepoint2text.parsing.extractors.serialization import (
     deserialize_extraction,
@@ -1149,11 +1149,23 @@ class PdfImage(ImageInterface):
     color_space: str = ""
     bits_per_component: int = 8
     filter: str = ""
+    # Decoded on first access when a data loader is set (see set_data_loader)
     data: bytes = b""
     format: str = ""
     content_type: str = ""
     unit_name: Optional[int] = None
 
+    def set_data_loader(self, loader: Callable[[], bytes]) -> None:
+        """Defer ``data`` to ``loader``, called once on first access."""
+        self._data_loader = loader
+
+    def __getstate__(self) -> dict:
+        # Materialize lazy data; the loader references the open PDF document
+        state = self.__dict__.copy()
+        state["_data"] = self.data
+        state["_data_loader"] = None
+        return state
+
     def get_bytes(self) -> io.BytesIO:
         """Returns the bytes of the image as a BytesIO object."""
         fl = io.BytesIO(self.data)
@@ -1182,6 +1194,26 @@ class PdfImage(ImageInterface):
         )
 
 
+def _get_pdf_image_data(self: PdfImage) -> bytes:
+    loader = self._data_loader
+    if loader is not None:
+        self._data = loader()
+        self._data_loader = None
+    return self._data
+
+
+def _set_pdf_image_data(self: PdfImage, value: bytes) -> None:
+    self._data = value
+    self._data_loader = None
+
+
+# Installed after @dataclass so ``data`` stays a regular field for __init__,
+# fields() and (de)serialization while the image stream is decoded lazily.
+PdfImage.data = property(  # type: ignore[assignment]
+    _get_pdf_image_data, _set_pdf_image_data
+)
+
+
 @dataclass
 class PdfPage:
     text: str = ""
@@ -2116,6 +2148,7 @@ class OpenDocumentImage(ImageInterface):
     href: str = ""
     name: str = ""
     content_type: str = ""
+    # Read on first access when a data loader is set (see set_data_loader)
     data: Optional[io.BytesIO] = None
     size_bytes: int = 0
     width: Optional[str] = None
@@ -2126,6 +2159,17 @@ class OpenDocumentImage(ImageInterface):
     description: str = ""  # From svg:desc (alt text)
     unit_name: Optional[int] = None  # Page/slide number (None for ODT/ODS)
 
+    def set_data_loader(self, loader: Callable[[], bytes]) -> None:
+        """Defer ``data`` to ``loader``, called once on first access."""
+        self._data_loader = loader
+
+    def __getstate__(self) -> dict:
+        # Materialize lazy data; the loader references the source archive
+        state = self.__dict__.copy()
+        state["_data"] = self.data
+        state["_data_loader"] = None
+        return state
+
     def get_bytes(self) -> io.BytesIO:
         """Returns the bytes of the image as a BytesIO object."""
         if self.data is None:
@@ -2158,6 +2202,35 @@ class OpenDocumentImage(ImageInterface):
         )
 
 
+def _get_open_document_image_data(
+    self: OpenDocumentImage,
+) -> Optional[io.BytesIO]:
+    loader = self._data_loader
+    if loader is not None:
+        self._data_loader = None
+        try:
+            self._data = io.BytesIO(loader())
+        except Exception as exc:
+            # Same outcome as an eager read failing during extraction
+            self._data = None
+            self.error = str(exc)
+    return self._data
+
+
+def _set_open_document_image_data(
+    self: OpenDocumentImage, value: Optional[io.BytesIO]
+) -> None:
+    self._data = value
+    self._data_loader = None
+
+
+# Installed after @dataclass like PdfImage.data: the archive member is only
+# decompressed when the image bytes are actually requested.
+OpenDocumentImage.data = property(  # type: ignore[assignment]
+    _get_open_document_image_data, _set_open_document_image_data
+)
+
+
 ###############
 # OpenDocument ODG (Drawing) #
 ###############
@@ -99,8 +99,11 @@ Maintenance Notes
 """
 
 import io
+import itertools
 import logging
-from typing import Any, Generator, List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Generator, List, Optional
 from xml.etree import ElementTree as ET
 
 from sharepoint2text.parsing.exceptions import (
@@ -200,6 +203,14 @@ FOOTER_TYPES = frozenset({"ftr"})
 # Note: sldNum (slide number) is NOT skipped - it goes to other_textboxes
 SKIP_TYPES = frozenset({"dt", "sldImg", "hdr"})
 
+# Placeholder type -> text category, so each shape needs one dict lookup
+_PLACEHOLDER_CATEGORIES: dict[str, str] = {
+    **dict.fromkeys(TITLE_TYPES, "title"),
+    **dict.fromkeys(FOOTER_TYPES, "footer"),
+    **dict.fromkeys(SKIP_TYPES, "skip"),
+    **dict.fromkeys(BODY_TYPES, "content"),
+}
+
 # Content type mapping by file extension (cached at module level)
 _CONTENT_TYPE_MAP = {
     "png": "image/png",
@@ -282,9 +293,10 @@ class _PptxContext(OOXMLZipContext):
     """
     Cached context for PPTX extraction.
 
-    Opens the ZIP file once and caches all parsed XML documents and
+    Opens the ZIP file once and caches the presentation-level XML and
     extracted data that is reused across multiple extraction functions.
-    This avoids repeatedly opening the ZIP and parsing the same XML files.
+    Slide, slide relationship and comment parts are parsed on demand, so
+    only the slide being processed is held as an XML tree.
     """
 
     def __init__(self, file_like: io.BytesIO):
@@ -296,19 +308,17 @@ class _PptxContext(OOXMLZipContext):
         self._presentation_root: ET.Element | None = None
         self._presentation_rels_root: ET.Element | None = None
 
-        # Cache for slide-related XML (keyed by path)
-        self._slide_roots: dict[str, ET.Element] = {}
-        self._slide_rels_roots: dict[str, ET.Element] = {}
-        self._comment_roots: dict[str, ET.Element] = {}
-
         # Cache for extracted data
         self._slide_order: list[str] | None = None
         self._slide_relationships: dict[str, dict[str, dict[str, str]]] = {}
+        # Media parts keyed by path; a logo repeated on every slide is read
+        # once and shared by all PptxImage objects that reference it
+        self._image_data: dict[str, bytes] = {}
 
         self._load_xml_files()
 
     def _load_xml_files(self) -> None:
-        """Load and parse all XML files from the ZIP at once."""
+        """Load and parse the presentation-level XML files."""
         # Core properties (metadata)
         if "docProps/core.xml" in self._namelist:
             self._core_root = self.read_xml_root("docProps/core.xml")
@@ -325,22 +335,10 @@ class _PptxContext(OOXMLZipContext):
         # Pre-compute slide order so we know which slides to load
         self._slide_order = self._compute_slide_order()
 
-        # Load all slide XML files
-        for slide_path in self._slide_order:
-            if slide_path in self._namelist:
-                self._slide_roots[slide_path] = self.read_xml_root(slide_path)
-
-                # Load slide relationships
-                slide_dir = "/".join(slide_path.rsplit("/", 1)[:-1])
-                slide_name = slide_path.rsplit("/", 1)[-1]
-                rels_path = f"{slide_dir}/_rels/{slide_name}.rels"
-                if rels_path in self._namelist:
-                    self._slide_rels_roots[slide_path] = self.read_xml_root(rels_path)
-
-        # Load all comment files
-        for name in self._namelist:
-            if name.startswith("ppt/comments/comment") and name.endswith(".xml"):
-                self._comment_roots[name] = self.read_xml_root(name)
+    def _read_optional_xml_root(self, path: str) -> ET.Element | None:
+        if path not in self._namelist:
+            return None
+        return self.read_xml_root(path)
 
     def _compute_slide_order(self) -> list[str]:
         """Compute slide order from cached presentation XML."""
@@ -380,8 +378,8 @@ class _PptxContext(OOXMLZipContext):
         return self._slide_order
 
     def get_slide_root(self, slide_path: str) -> ET.Element | None:
-        """Get cached slide XML root."""
-        return self._slide_roots.get(slide_path)
+        """Parse the slide XML root."""
+        return self._read_optional_xml_root(slide_path)
 
     def get_slide_relationships(self, slide_path: str) -> dict[str, dict[str, str]]:
         """Get cached relationships for a slide."""
@@ -389,7 +387,8 @@ class _PptxContext(OOXMLZipContext):
             return self._slide_relationships[slide_path]
 
         relationships = {}
-        rels_root = self._slide_rels_roots.get(slide_path)
+        slide_dir, _, slide_name = slide_path.rpartition("/")
+        rels_root = self._read_optional_xml_root(f"{slide_dir}/_rels/{slide_name}.rels")
         if rels_root is not None:
             for rel in parse_relationships(rels_root):
                 rel_id = rel["id"]
@@ -404,15 +403,17 @@ class _PptxContext(OOXMLZipContext):
         return relationships
 
     def get_comment_root(self, slide_number: int) -> ET.Element | None:
-        """Get cached comment XML root for a slide."""
-        comment_file = f"ppt/comments/comment{slide_number}.xml"
-        return self._comment_roots.get(comment_file)
+        """Parse the comment XML root for a slide."""
+        return self._read_optional_xml_root(f"ppt/comments/comment{slide_number}.xml")
 
     def get_image_data(self, image_path: str) -> bytes | None:
-        """Read image data from the ZIP file."""
+        """Read image data from the ZIP file, once per media part."""
         if image_path not in self._namelist:
             return None
-        return self.read_bytes(image_path)
+        blob = self._image_data.get(image_path)
+        if blob is None:
+            blob = self._image_data[image_path] = self.read_bytes(image_path)
+        return blob
 
 
 def _get_element_text(root: ET.Element | None, tag: str) -> str | None:
@@ -508,7 +509,31 @@ def _extract_slide_comments_from_context(
     return comments
 
 
-def _get_shape_position(shape_elem: ET.Element) -> tuple[int, int]:
+def _get_placeholder(shape_elem: ET.Element) -> ET.Element | None:
+    """Return the p:ph element of a shape, or None if it is not a placeholder."""
+    nv_sp_pr = shape_elem.find(P_NVSPPR)
+    if nv_sp_pr is None:
+        return None
+    nv_pr = nv_sp_pr.find(P_NVPR)
+    if nv_pr is None:
+        return None
+    return nv_pr.find(P_PH)
+
+
+def _placeholder_category(ph: ET.Element) -> str:
+    """Map a p:ph element to title/footer/skip/content/other."""
+    ph_type = ph.get("type", "")
+    category = _PLACEHOLDER_CATEGORIES.get(ph_type)
+    if category is not None:
+        return category
+    if not ph_type and ph.get("idx", ""):
+        return "content"
+    return "other"
+
+
+def _get_shape_position(
+    shape_elem: ET.Element, ph: ET.Element | None
+) -> tuple[int, int]:
     """
     Get the position of a shape element for sorting purposes.
 
@@ -517,6 +542,7 @@ def _get_shape_position(shape_elem: ET.Element) -> tuple[int, int]:
 
     Args:
         shape_elem: XML Element representing a shape (p:sp or p:pic).
+        ph: The shape's p:ph element as returned by _get_placeholder().
 
     Returns:
         Tuple of (top, left) coordinates. For shapes without explicit
@@ -551,24 +577,19 @@ def _get_shape_position(shape_elem: ET.Element) -> tuple[int, int]:
                 return (y, x)  # Sort by y (top) first, then x (left)
 
         # No explicit position - check if it's a placeholder and assign default
-        nv_sp_pr = shape_elem.find(P_NVSPPR)
-        if nv_sp_pr is not None:
-            nv_pr = nv_sp_pr.find(P_NVPR)
-            if nv_pr is not None:
-                ph = nv_pr.find(P_PH)
-                if ph is not None:
-                    ph_type = ph.get("type", "")
-                    ph_idx = ph.get("idx", "")
+        if ph is not None:
+            ph_type = ph.get("type", "")
+            ph_idx = ph.get("idx", "")
 
-                    if ph_type in TITLE_TYPES:
-                        return (0, 0)
+            if ph_type in TITLE_TYPES:
+                return (0, 0)
 
-                    if ph_type in BODY_TYPES or (not ph_type and ph_idx):
-                        idx_num = int(ph_idx) if ph_idx.isdigit() else 0
-                        return (1 + idx_num, 0)
+            if ph_type in BODY_TYPES or (not ph_type and ph_idx):
+                idx_num = int(ph_idx) if ph_idx.isdigit() else 0
+                return (1 + idx_num, 0)
 
-                    if ph_type in FOOTER_TYPES or ph_type == "sldNum":
-                        return (999999998, 0)
+            if ph_type in FOOTER_TYPES or ph_type == "sldNum":
+                return (999999998, 0)
 
         return (999999999, 999999999)
     except Exception:
@@ -711,14 +732,18 @@ def _normalize_relative_path(base_dir: str, target: str) -> str:
     return f"{base_dir}/{target}"
 
 
+# (shape kind, shape element, reading-order position, p:ph element or None)
+_ShapeEntry = tuple[str, ET.Element, tuple[int, int], ET.Element | None]
+
+
 def _process_slide_from_context(
     ctx: _PptxContext, slide_path: str, slide_number: int
 ) -> PptxSlide:
     """
-    Process a single slide and extract all its content using cached XML.
+    Process a single slide and extract all its content.
 
     Args:
-        ctx: PptxContext with cached XML roots.
+        ctx: PptxContext providing the slide XML and relationships.
         slide_path: Path to the slide XML file within the ZIP.
         slide_number: 1-based slide number.
 
@@ -745,21 +770,26 @@ def _process_slide_from_context(
     if sp_tree is None:
         return PptxSlide(slide_number=slide_number)
 
-    # Collect all shapes with their positions
-    shape_elements: list[tuple[str, ET.Element, tuple[int, int]]] = []
-    for sp in sp_tree.iter(P_SP):
-        shape_elements.append(("sp", sp, _get_shape_position(sp)))
-    for pic in sp_tree.iter(P_PIC):
-        shape_elements.append(("pic", pic, _get_shape_position(pic)))
-    for frame in sp_tree.iter(P_GRAPHICFRAME):
-        shape_elements.append(("graphicFrame", frame, _get_shape_position(frame)))
+    # Collect all shapes with their positions; the placeholder element is
+    # looked up once and reused for both ordering and categorisation.
+    shape_elements: list[_ShapeEntry] = []
+    for shape_type, tag in (
+        ("sp", P_SP),
+        ("pic", P_PIC),
+        ("graphicFrame", P_GRAPHICFRAME),
+    ):
+        for shape in sp_tree.iter(tag):
+            ph = _get_placeholder(shape)
+            shape_elements.append(
+                (shape_type, shape, _get_shape_position(shape, ph), ph)
+            )
 
     shape_elements.sort(key=lambda x: x[2])
 
     image_counter = 0
     slide_dir = "/".join(slide_path.rsplit("/", 1)[:-1])
 
-    for shape_type, elem, position in shape_elements:
+    for shape_type, elem, position, ph in shape_elements:
         # Picture extraction
         if shape_type == "pic":
             try:
@@ -825,19 +855,21 @@ def _process_slide_from_context(
             continue
 
         # Shape (text) extraction
-        nv_sp_pr = elem.find(P_NVSPPR)
-        if nv_sp_pr is None:
+        if elem.find(P_NVSPPR) is None:
             continue
 
-        nv_pr = nv_sp_pr.find(P_NVPR)
-        ph = nv_pr.find(P_PH) if nv_pr is not None else None
-
         # Extract formulas from shape
         for latex, is_display in _extract_formulas_from_element(elem):
             formulas.append(PptxFormula(latex=latex, is_display=is_display))
             formula_text = f"$${latex}$$" if is_display else f"${latex}$"
             ordered_content.append((position, "formula", formula_text))
 
+        # Determine the placeholder category first so that skipped
+        # placeholders (date, header, slide image) never build their text
+        category = _placeholder_category(ph) if ph is not None else "other"
+        if category == "skip":
+            continue
+
         # Extract text
         tx_body = elem.find(P_TXBODY)
         if tx_body is None:
@@ -847,25 +879,15 @@ def _process_slide_from_context(
         if not text:
             continue
 
-        # Determine placeholder type and categorize text
-        if ph is not None:
-            ph_type = ph.get("type", "")
-            ph_idx = ph.get("idx", "")
-
-            if ph_type in TITLE_TYPES:
-                slide_title = text
-                ordered_content.append((position, "title", text))
-            elif ph_type in FOOTER_TYPES:
-                slide_footer = text
-            elif ph_type in SKIP_TYPES:
-                pass
-            elif ph_type in BODY_TYPES or (not ph_type and ph_idx):
-                content_placeholders.append(text)
-                ordered_content.append((position, "content", text))
-            else:
-                other_textboxes.append(text)
-                ordered_content.append((position, "other", text))
-        else:
+        if category == "title":
+            slide_title = text
+            ordered_content.append((position, "title", text))
+        elif category == "footer":
+            slide_footer = text
+        elif category == "content":
+            content_placeholders.append(text)
+            ordered_content.append((position, "content", text))
+        elif category == "other":
             other_textboxes.append(text)
             ordered_content.append((position, "other", text))
 
@@ -905,8 +927,75 @@ def _process_slide_from_context(
     )
 
 
+# Decks with fewer slides are always extracted in-process; starting a pool
+# costs more than it saves there.
+_MIN_POOL_SLIDES = 3
+# Target number of slide blocks handed to each worker (see _process_slides_in_pool)
+_POOL_BLOCKS_PER_WORKER = 4
+
+
+def _resolve_slide_workers(slide_workers: int, total_slides: int) -> int:
+    """Number of pool workers to use; 1 means extract in-process."""
+    if total_slides < _MIN_POOL_SLIDES:
+        return 1
+    if slide_workers == 0:
+        slide_workers = max(1, (os.cpu_count() or 1) - 1)
+    return max(1, min(slide_workers, total_slides))
+
+
+# Per-process context used by slide pool workers (see _process_slides_in_pool).
+_WORKER_CONTEXT: Optional[_PptxContext] = None
+
+
+def _init_slide_worker(pptx_bytes: bytes) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = _PptxContext(io.BytesIO(pptx_bytes))
+
+
+def _process_slide_in_worker(slide_path: str, slide_number: int) -> PptxSlide:
+    if _WORKER_CONTEXT is None:
+        raise RuntimeError("PPTX slide worker was not initialized")
+    return _process_slide_from_context(_WORKER_CONTEXT, slide_path, slide_number)
+
+
+def _process_slides_in_pool(
+    file_like: io.BytesIO, slide_paths: list[str], slide_workers: int
+) -> list[PptxSlide]:
+    """
+    Extract slides across a process pool.
+
+    Each worker opens its own ZIP context from the raw bytes once; slides are
+    submitted in contiguous blocks to keep IPC overhead low, and results are
+    collected in slide order.
+    """
+    total_slides = len(slide_paths)
+    chunksize = max(1, total_slides // (slide_workers * _POOL_BLOCKS_PER_WORKER))
+    logger.debug(
+        "Extracting %d PPTX slides with %d workers (blocks of %d)",
+        total_slides,
+        slide_workers,
+        chunksize,
+    )
+    with ProcessPoolExecutor(
+        max_workers=slide_workers,
+        initializer=_init_slide_worker,
+        initargs=(file_like.getvalue(),),
+    ) as executor:
+        return list(
+            executor.map(
+                _process_slide_in_worker,
+                slide_paths,
+                itertools.count(1),
+                chunksize=chunksize,
+            )
+        )
+
+
 def read_pptx(
-    file_like: io.BytesIO, path: str | None = None
+    file_like: io.BytesIO,
+    path: str | None = None,
+    *,
+    slide_workers: int = 1,
 ) -> Generator[PptxContent, Any, None]:
     """
     Extract all relevant content from a PowerPoint .pptx file.
@@ -924,6 +1013,12 @@ def read_pptx(
         path: Optional filesystem path to the source file. If provided,
             populates file metadata (filename, extension, folder) in the
             returned PptxContent.metadata.
+        slide_workers: Number of worker processes for per-slide extraction.
+            The default of 1 extracts slides in the calling process. Larger
+            values fan slides out to a ProcessPoolExecutor, which pays off for
+            large decks on multi-core hosts. 0 uses ``os.cpu_count() - 1``
+            workers (at least 1). Decks with fewer than three slides are
+            always extracted in-process.
 
     Yields:
         PptxContent: Single PptxContent object containing:
@@ -962,8 +1057,9 @@ def read_pptx(
         ...             print(f"    Images: {len(slide.images)}")
 
     Performance Notes:
-        - ZIP file is opened once and all XML is cached
-        - All XML documents are parsed once and reused
+        - ZIP file is opened once and presentation-level XML is cached
+        - Slide and comment XML is parsed when the slide is processed and
+          released afterwards
         - Images are loaded into memory as binary blobs
         - Large presentations with many images may use significant memory
     """
@@ -975,7 +1071,7 @@ def read_pptx(
                 "PPTX is encrypted or password-protected"
             )
 
-        # Create context that opens ZIP once and caches all parsed XML
+        # Create context that opens ZIP once and caches presentation XML
         ctx = _PptxContext(file_like)
         try:
             # Extract metadata from cached XML
@@ -984,11 +1080,16 @@ def read_pptx(
             # Get slide order from cached presentation.xml
             slide_paths = ctx.slide_order
 
-            # Process each slide using cached XML
-            slides_result: List[PptxSlide] = []
-            for slide_index, slide_path in enumerate(slide_paths, start=1):
-                slide = _process_slide_from_context(ctx, slide_path, slide_index)
-                slides_result.append(slide)
+            # Process each slide; its XML is parsed on demand
+            slides_result: List[PptxSlide]
+            workers = _resolve_slide_workers(slide_workers, len(slide_paths))
+            if workers > 1:
+                slides_result = _process_slides_in_pool(file_like, slide_paths, workers)
+            else:
+                slides_result = [
+                    _process_slide_from_context(ctx, slide_path, slide_index)
+                    for slide_index, slide_path in enumerate(slide_paths, start=1)
+                ]
 
             metadata.populate_from_path(path)
 
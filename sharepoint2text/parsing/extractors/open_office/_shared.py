@@ -1,17 +1,59 @@
 from __future__ import annotations
 
 import mimetypes
+import os
 from functools import lru_cache
+from typing import Callable, Iterator
 from xml.etree import ElementTree as ET
 
 from sharepoint2text.parsing.extractors.data_types import OpenDocumentMetadata
 
 
-@lru_cache(maxsize=512)
 def guess_content_type(path: str) -> str:
+    # Embedded parts have unique names (Pictures/<hash>.png), so cache by
+    # extension. Encoding suffixes such as .gz depend on the inner extension
+    # and are resolved from the full path.
+    ext = os.path.splitext(path)[1].lower()
+    if ext in mimetypes.encodings_map or ext in mimetypes.suffix_map:
+        return _guess_type(path)
+    return _guess_type_for_extension(ext)
+
+
+@lru_cache(maxsize=64)
+def _guess_type_for_extension(ext: str) -> str:
+    return _guess_type(f"file{ext}")
+
+
+def _guess_type(path: str) -> str:
     return mimetypes.guess_type(path)[0] or "application/octet-stream"
 
 
+# (namespace prefix, local name, OpenDocumentMetadata attribute)
+_METADATA_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("dc", "title", "title"),
+    ("dc", "description", "description"),
+    ("dc", "subject", "subject"),
+    ("dc", "creator", "creator"),
+    ("dc", "date", "date"),
+    ("dc", "language", "language"),
+    ("meta", "keyword", "keywords"),
+    ("meta", "initial-creator", "initial_creator"),
+    ("meta", "creation-date", "creation_date"),
+    ("meta", "editing-cycles", "editing_cycles"),
+    ("meta", "editing-duration", "editing_duration"),
+    ("meta", "generator", "generator"),
+)
+
+
+@lru_cache(maxsize=8)
+def _metadata_tag_fields(dc_ns: str, meta_ns: str) -> dict[str, str]:
+    namespaces = {"dc": dc_ns, "meta": meta_ns}
+    return {
+        f"{{{namespaces[prefix]}}}{local}": field
+        for prefix, local, field in _METADATA_FIELDS
+    }
+
+
 def extract_odf_metadata(
     meta_root: ET.Element | None, ns: dict[str, str]
 ) -> OpenDocumentMetadata:
@@ -23,58 +65,50 @@ def extract_odf_metadata(
     if meta_elem is None:
         return metadata
 
-    title = meta_elem.find("dc:title", ns)
-    if title is not None and title.text:
-        metadata.title = title.text
-
-    description = meta_elem.find("dc:description", ns)
-    if description is not None and description.text:
-        metadata.description = description.text
-
-    subject = meta_elem.find("dc:subject", ns)
-    if subject is not None and subject.text:
-        metadata.subject = subject.text
-
-    creator = meta_elem.find("dc:creator", ns)
-    if creator is not None and creator.text:
-        metadata.creator = creator.text
-
-    date = meta_elem.find("dc:date", ns)
-    if date is not None and date.text:
-        metadata.date = date.text
-
-    language = meta_elem.find("dc:language", ns)
-    if language is not None and language.text:
-        metadata.language = language.text
-
-    keywords = meta_elem.find("meta:keyword", ns)
-    if keywords is not None and keywords.text:
-        metadata.keywords = keywords.text
-
-    initial_creator = meta_elem.find("meta:initial-creator", ns)
-    if initial_creator is not None and initial_creator.text:
-        metadata.initial_creator = initial_creator.text
+    # Single pass over the direct children; only the first occurrence of each
+    # field counts, matching what a per-field find() would return.
+    tag_fields = _metadata_tag_fields(ns["dc"], ns["meta"])
+    seen: set[str] = set()
+    for child in meta_elem:
+        field = tag_fields.get(child.tag)
+        if field is None or field in seen:
+            continue
+        seen.add(field)
+        text = child.text
+        if not text:
+            continue
+        if field == "editing_cycles":
+            try:
+                metadata.editing_cycles = int(text)
+            except ValueError:
+                pass
+        else:
+            setattr(metadata, field, text)
 
-    creation_date = meta_elem.find("meta:creation-date", ns)
-    if creation_date is not None and creation_date.text:
-        metadata.creation_date = creation_date.text
+    return metadata
 
-    editing_cycles = meta_elem.find("meta:editing-cycles", ns)
-    if editing_cycles is not None and editing_cycles.text:
-        try:
-            metadata.editing_cycles = int(editing_cycles.text)
-        except ValueError:
-            pass
 
-    editing_duration = meta_elem.find("meta:editing-duration", ns)
-    if editing_duration is not None and editing_duration.text:
-        metadata.editing_duration = editing_duration.text
+_SKIP = 0
+_SPACE = 1
+_TAB = 2
+_LINE_BREAK = 3
 
-    generator = meta_elem.find("meta:generator", ns)
-    if generator is not None and generator.text:
-        metadata.generator = generator.text
 
-    return metadata
+@lru_cache(maxsize=32)
+def _special_tag_kinds(
+    text_space_tag: str,
+    text_tab_tag: str,
+    text_line_break_tag: str,
+    skip_tags: frozenset[str],
+) -> dict[str, int]:
+    kinds = {
+        text_space_tag: _SPACE,
+        text_tab_tag: _TAB,
+        text_line_break_tag: _LINE_BREAK,
+    }
+    for tag in skip_tags:
+        kinds[tag] = _SKIP
+    return kinds
 
 
 def element_text(
@@ -86,60 +120,80 @@ def element_text(
     attr_text_c: str,
     skip_tags: set[str] | None = None,
 ) -> str:
-    parts: list[str] = []
-    _append_element_text(
-        element,
-        parts,
-        text_space_tag=text_space_tag,
-        text_tab_tag=text_tab_tag,
-        text_line_break_tag=text_line_break_tag,
-        attr_text_c=attr_text_c,
-        skip_tags=skip_tags or set(),
+    kinds = _special_tag_kinds(
+        text_space_tag,
+        text_tab_tag,
+        text_line_break_tag,
+        frozenset(skip_tags) if skip_tags else frozenset(),
     )
+    parts: list[str] = []
+    _append_element_text(element, parts, kinds, attr_text_c)
     return "".join(parts)
 
 
 def _append_element_text(
     element: ET.Element,
     parts: list[str],
-    *,
-    text_space_tag: str,
-    text_tab_tag: str,
-    text_line_break_tag: str,
+    kinds: dict[str, int],
     attr_text_c: str,
-    skip_tags: set[str],
 ) -> None:
     text = element.text
     if text:
         parts.append(text)
 
-    for child in element:
-        tag = child.tag
-        if tag in skip_tags:
-            pass
-        elif tag == text_space_tag:
-            raw_count = child.get(attr_text_c, "1")
-            try:
-                count = int(raw_count)
-            except ValueError:
-                count = 1
-            if count > 0:
-                parts.append(" " * count)
-        elif tag == text_tab_tag:
-            parts.append("\t")
-        elif tag == text_line_break_tag:
-            parts.append("\n")
+    # Explicit stack of (children iterator, tail to emit once exhausted) so
+    # deeply nested spans neither cost a Python frame per element nor hit the
+    # recursion limit.
+    stack: list[tuple[Iterator[ET.Element], str | None]] = [(iter(element), None)]
+    while stack:
+        children, _ = stack[-1]
+        for child in children:
+            kind = kinds.get(child.tag)
+            if kind is None:
+                text = child.text
+                if text:
+                    parts.append(text)
+                stack.append((iter(child), child.tail))
+                break
+            if kind == _SPACE:
+                raw_count = child.get(attr_text_c, "1")
+                try:
+                    count = int(raw_count)
+                except ValueError:
+                    count = 1
+                if count > 0:
+                    parts.append(" " * count)
+            elif kind == _TAB:
+                parts.append("\t")
+            elif kind == _LINE_BREAK:
+                parts.append("\n")
+
+            tail = child.tail
+            if tail:
+                parts.append(tail)
         else:
-            _append_element_text(
-                child,
-                parts,
-                text_space_tag=text_space_tag,
-                text_tab_tag=text_tab_tag,
-                text_line_break_tag=text_line_break_tag,
-                attr_text_c=attr_text_c,
-                skip_tags=skip_tags,
-            )
-
-        tail = child.tail
-        if tail:
-            parts.append(tail)
+            _, tail = stack.pop()
+            if tail:
+                parts.append(tail)
+
+
+def text_block_lines(
+    root: ET.Element,
+    get_text: Callable[[ET.Element], str],
+    *,
+    text_p_tag: str,
+    text_h_tag: str,
+) -> list[str]:
+    # iter(tag) filters in C; only trees that also contain headings need the
+    # full walk to keep text:h/text:p in document order.
+    if next(root.iter(text_h_tag), None) is None:
+        blocks: Iterator[ET.Element] = root.iter(text_p_tag)
+    else:
+        block_tags = {text_h_tag, text_p_tag}
+        blocks = (e for e in root.iter() if e.tag in block_tags)
+    lines: list[str] = []
+    for elem in blocks:
+        value = get_text(elem).strip()
+        if value:
+            lines.append(value)
+    return lines
@@ -18,7 +18,8 @@ and falls back to a best-effort itertext() representation when needed.
 
 import io
 import logging
-from typing import Any, Generator
+import re
+from typing import Any, Callable, Generator
 from xml.etree import ElementTree as ET
 
 from sharepoint2text.parsing.exceptions import (
@@ -33,8 +34,8 @@ from sharepoint2text.parsing.extractors.data_types import (
 from sharepoint2text.parsing.extractors.open_office._shared import (
     element_text,
     extract_odf_metadata,
+    text_block_lines,
 )
-from sharepoint2text.parsing.extractors.util.encryption import is_odf_encrypted
 from sharepoint2text.parsing.extractors.util.zip_context import ZipContext
 
 logger = logging.getLogger(__name__)
@@ -62,6 +63,8 @@ _MATH_MATH_TAG = f"{{{NS['math']}}}math"
 
 _ATTR_TEXT_C = f"{{{NS['text']}}}c"
 
+_STARMATH_FRAC_RE = re.compile(r"^frac\s*\{\s*(.*?)\s*\}\s*\{\s*(.*?)\s*\}\s*$")
+
 _TEXT_SKIP_TAGS: set[str] = {_OFFICE_ANNOTATION_TAG}
 
 
@@ -82,7 +85,17 @@ def _extract_metadata(meta_root: ET.Element | None) -> OpenDocumentMetadata:
 
 
 def _normalize_whitespace(value: str) -> str:
-    return " ".join(value.split()).strip()
+    # Strings without tabs/newlines/other separators (isprintable() rejects
+    # every whitespace except " "), double spaces or edge spaces are already
+    # normalized; skip the split/join allocation for them.
+    if (
+        value.isprintable()
+        and "  " not in value
+        and value[:1] != " "
+        and value[-1:] != " "
+    ):
+        return value
+    return " ".join(value.split())
 
 
 def _parse_starmath_annotation(value: str) -> str | None:
@@ -92,12 +105,10 @@ def _parse_starmath_annotation(value: str) -> str | None:
     LibreOffice Math often stores StarMath source like: `frac {4} {7}`
     """
     value = _normalize_whitespace(value)
-    if not value:
+    if not value.startswith("frac"):
         return None
 
-    import re
-
-    m = re.match(r"^frac\s*\{\s*(.*?)\s*\}\s*\{\s*(.*?)\s*\}\s*$", value)
+    m = _STARMATH_FRAC_RE.match(value)
     if m:
         num, den = m.group(1), m.group(2)
         num = _normalize_whitespace(num)
@@ -112,65 +123,58 @@ def _mathml_tag(local: str) -> str:
     return f"{{{NS['math']}}}{local}"
 
 
-def _mathml_to_text(elem: ET.Element) -> str:
-    """Convert a subset of MathML to a readable plain-text expression."""
-    tag = elem.tag
+def _mathml_children_to_text(elem: ET.Element) -> str:
+    return "".join(map(_mathml_to_text, elem))
 
-    if tag == _MATH_ANNOTATION_TAG:
-        # Prefer extracting math:annotation via the dedicated annotation pass in
-        # _extract_full_text(). Exclude it from MathML rendering to avoid
-        # concatenating the annotation source with the rendered formula.
-        return ""
 
-    if (
-        tag == _mathml_tag("math")
-        or tag == _mathml_tag("semantics")
-        or tag == _mathml_tag("mrow")
-    ):
-        parts = [_mathml_to_text(child) for child in elem]
-        return "".join(p for p in parts if p)
-
-    if tag == _mathml_tag("mfrac"):
-        children = list(elem)
-        if len(children) >= 2:
-            num = _mathml_to_text(children[0]).strip()
-            den = _mathml_to_text(children[1]).strip()
-            if num and den:
-                return f"{num}/{den}"
-        return ""
+def _mathml_leaf_to_text(elem: ET.Element) -> str:
+    return (elem.text or "").strip()
+
+
+def _mathml_annotation_to_text(elem: ET.Element) -> str:
+    # Prefer extracting math:annotation via the dedicated annotation pass in
+    # _extract_full_text(). Exclude it from MathML rendering to avoid
+    # concatenating the annotation source with the rendered formula.
+    return ""
 
-    if tag == _mathml_tag("msup"):
-        children = list(elem)
-        if len(children) >= 2:
-            base = _mathml_to_text(children[0]).strip()
-            exp = _mathml_to_text(children[1]).strip()
-            if base and exp:
-                return f"{base}^{exp}"
-        return ""
 
-    if tag == _mathml_tag("msub"):
-        children = list(elem)
-        if len(children) >= 2:
-            base = _mathml_to_text(children[0]).strip()
-            sub = _mathml_to_text(children[1]).strip()
-            if base and sub:
-                return f"{base}_{sub}"
+def _mathml_binary_handler(separator: str) -> Callable[[ET.Element], str]:
+    def handler(elem: ET.Element) -> str:
+        if len(elem) >= 2:
+            left = _mathml_to_text(elem[0]).strip()
+            right = _mathml_to_text(elem[1]).strip()
+            if left and right:
+                return f"{left}{separator}{right}"
         return ""
 
-    if tag in (
-        _mathml_tag("mi"),
-        _mathml_tag("mn"),
-        _mathml_tag("mo"),
-        _mathml_tag("mtext"),
-    ):
-        return (elem.text or "").strip()
+    return handler
+
 
+def _mathml_default_to_text(elem: ET.Element) -> str:
     # Many MathML elements are wrappers; recurse through children.
-    if list(elem):
-        parts = [_mathml_to_text(child) for child in elem]
-        return "".join(p for p in parts if p)
+    if len(elem):
+        return _mathml_children_to_text(elem)
+    return _mathml_leaf_to_text(elem)
+
+
+_MATHML_HANDLERS: dict[str, Callable[[ET.Element], str]] = {
+    _MATH_ANNOTATION_TAG: _mathml_annotation_to_text,
+    _mathml_tag("math"): _mathml_children_to_text,
+    _mathml_tag("semantics"): _mathml_children_to_text,
+    _mathml_tag("mrow"): _mathml_children_to_text,
+    _mathml_tag("mfrac"): _mathml_binary_handler("/"),
+    _mathml_tag("msup"): _mathml_binary_handler("^"),
+    _mathml_tag("msub"): _mathml_binary_handler("_"),
+    _mathml_tag("mi"): _mathml_leaf_to_text,
+    _mathml_tag("mn"): _mathml_leaf_to_text,
+    _mathml_tag("mo"): _mathml_leaf_to_text,
+    _mathml_tag("mtext"): _mathml_leaf_to_text,
+}
 
-    return (elem.text or "").strip()
+
+def _mathml_to_text(elem: ET.Element) -> str:
+    """Convert a subset of MathML to a readable plain-text expression."""
+    return _MATHML_HANDLERS.get(elem.tag, _mathml_default_to_text)(elem)
 
 
 def _extract_formula_text_from_mathml(root: ET.Element) -> str:
@@ -193,14 +197,19 @@ def _extract_full_text(content_root: ET.Element) -> str:
       - a plain MathML `math` root in content.xml
     """
     # 1) Prefer StarMath annotations when present (often closest to author intent)
+    # Deduplicated in document order as they are collected.
     annotations: list[str] = []
+    seen: set[str] = set()
     for ann in content_root.iter(_MATH_ANNOTATION_TAG):
         raw = (ann.text or "").strip()
         if not raw:
             continue
         parsed = _parse_starmath_annotation(raw)
-        annotations.append(parsed if parsed is not None else _normalize_whitespace(raw))
-    annotations = [a for a in annotations if a]
+        value = parsed if parsed is not None else _normalize_whitespace(raw)
+        if not value or value in seen:
+            continue
+        seen.add(value)
+        annotations.append(value)
 
     if annotations:
         # If we can parse a concise form (e.g., fractions), return those.
@@ -208,11 +217,11 @@ def _extract_full_text(content_root: ET.Element) -> str:
             a for a in annotations if "/" in a or "^" in a or "_" in a
         ]
         if parsed_annotations:
-            return "\n".join(dict.fromkeys(parsed_annotations)).strip()
+            return "\n".join(parsed_annotations).strip()
 
         # Otherwise return the normalized StarMath source (Apache OpenOffice
         # commonly stores the most readable form here).
-        return "\n".join(dict.fromkeys(annotations)).strip()
+        return "\n".join(annotations).strip()
 
     # 2) Try to render MathML directly (e.g., mfrac -> a/b)
     math_text = _extract_formula_text_from_mathml(content_root)
@@ -220,12 +229,12 @@ def _extract_full_text(content_root: ET.Element) -> str:
         return math_text
 
     # 3) Fall back to any surrounding text:p/text:h (if formula is embedded in an ODF doc)
-    lines: list[str] = []
-    for elem in content_root.iter():
-        if elem.tag in (_TEXT_H_TAG, _TEXT_P_TAG):
-            value = _get_text_recursive(elem).strip()
-            if value:
-                lines.append(value)
+    lines = text_block_lines(
+        content_root,
+        _get_text_recursive,
+        text_p_tag=_TEXT_P_TAG,
+        text_h_tag=_TEXT_H_TAG,
+    )
     if lines:
         return "\n".join(lines).strip()
 
@@ -238,12 +247,15 @@ def read_odf(
 ) -> Generator[OdfContent, Any, None]:
     """Extract text and metadata from an ODF formula file."""
     try:
-        file_like.seek(0)
-        if is_odf_encrypted(file_like):
-            raise ExtractionFileEncryptedError("ODF is encrypted or password-protected")
-
+        # Open the archive once; the encryption check reads the manifest
+        # through the same parsed central directory.
         ctx = ZipContext(file_like)
         try:
+            if ctx.is_odf_encrypted():
+                raise ExtractionFileEncryptedError(
+                    "ODF is encrypted or password-protected"
+                )
+
             meta_root = (
                 ctx.read_xml_root("meta.xml") if ctx.exists("meta.xml") else None
             )
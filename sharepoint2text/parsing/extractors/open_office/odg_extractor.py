@@ -16,7 +16,7 @@ specification (ISO/IEC 26300). Key components:
 
 import io
 import logging
-from typing import Any, Generator
+from typing import Any, Generator, Iterable, Iterator
 from xml.etree import ElementTree as ET
 
 from sharepoint2text.parsing.exceptions import (
@@ -33,6 +33,7 @@ from sharepoint2text.parsing.extractors.open_office._shared import (
     element_text,
     extract_odf_metadata,
     guess_content_type,
+    text_block_lines,
 )
 from sharepoint2text.parsing.extractors.util.encryption import is_odf_encrypted
 from sharepoint2text.parsing.extractors.util.zip_context import ZipContext
@@ -56,6 +57,9 @@ _TEXT_TAB_TAG = f"{{{NS['text']}}}tab"
 _TEXT_LINE_BREAK_TAG = f"{{{NS['text']}}}line-break"
 _OFFICE_ANNOTATION_TAG = f"{{{NS['office']}}}annotation"
 
+_OFFICE_BODY_TAG = f"{{{NS['office']}}}body"
+_OFFICE_DRAWING_TAG = f"{{{NS['office']}}}drawing"
+
 _TEXT_P_TAG = f"{{{NS['text']}}}p"
 _TEXT_H_TAG = f"{{{NS['text']}}}h"
 _DRAW_FRAME_TAG = f"{{{NS['draw']}}}frame"
@@ -72,6 +76,9 @@ _ATTR_SVG_HEIGHT = f"{{{NS['svg']}}}height"
 
 _TEXT_SKIP_TAGS: set[str] = {_OFFICE_ANNOTATION_TAG}
 
+# Elements whose subtrees are extracted as a whole while streaming content.xml
+_UNIT_TAGS = frozenset({_TEXT_H_TAG, _TEXT_P_TAG, _DRAW_FRAME_TAG})
+
 
 def _get_text_recursive(element: ET.Element) -> str:
     return element_text(
@@ -89,22 +96,69 @@ def _extract_metadata(meta_root: ET.Element | None) -> OpenDocumentMetadata:
     return extract_odf_metadata(meta_root, NS)
 
 
-def _extract_full_text(drawing_root: ET.Element) -> str:
-    lines: list[str] = []
-    for elem in drawing_root.iter():
-        if elem.tag in (_TEXT_H_TAG, _TEXT_P_TAG):
-            value = _get_text_recursive(elem).strip()
-            if value:
-                lines.append(value)
-    return "\n".join(lines).strip()
+def _iter_drawing_units(
+    events: Iterable[tuple[str, ET.Element]],
+) -> Iterator[ET.Element]:
+    """
+    Yield the outermost text:p/text:h/draw:frame elements of the drawing body.
+
+    Consumes iterparse start/end events for content.xml. Each unit is yielded
+    once its end tag has been parsed and is cleared afterwards, as are other
+    finished elements of the drawing, so the document is never held in memory
+    as a whole. Like find(".//office:body/office:drawing"), only the first
+    office:drawing that is a child of office:body is considered.
+    """
+    open_tags: list[str] = []
+    drawing: ET.Element | None = None
+    in_drawing = False
+    unit_depth = 0
+    for event, elem in events:
+        if event == "start":
+            tag = elem.tag
+            if in_drawing:
+                if tag in _UNIT_TAGS:
+                    unit_depth += 1
+            elif (
+                drawing is None
+                and tag == _OFFICE_DRAWING_TAG
+                and open_tags
+                and open_tags[-1] == _OFFICE_BODY_TAG
+            ):
+                drawing = elem
+                in_drawing = True
+            open_tags.append(tag)
+            continue
+
+        open_tags.pop()
+        if not in_drawing:
+            continue
+        if elem is drawing:
+            in_drawing = False
+        elif elem.tag in _UNIT_TAGS:
+            unit_depth -= 1
+            if unit_depth == 0:
+                yield elem
+                elem.clear()
+        elif unit_depth == 0:
+            elem.clear()
+
+    if drawing is None:
+        raise ExtractionFailedError("Invalid ODG file: drawing body not found")
 
 
 def _extract_images(
-    ctx: ZipContext, drawing_root: ET.Element
+    ctx: ZipContext,
+    drawing_root: ET.Element,
+    processed_hrefs: set[str],
+    image_counter: int = 0,
 ) -> list[OpenDocumentImage]:
+    """
+    Extract images of the frames below drawing_root.
+
+    processed_hrefs and image_counter carry deduplication and numbering
+    across calls for successive parts of the same drawing.
+    """
     images: list[OpenDocumentImage] = []
-    processed_hrefs: set[str] = set()
-    image_counter = 0
 
     for frame in drawing_root.iter(_DRAW_FRAME_TAG):
         # Skip frames that are primarily text containers
@@ -148,37 +202,25 @@ def _extract_images(
             )
             continue
 
+        # EAFP: missing members are rare
         try:
-            if ctx.exists(href):
-                img_data = ctx.read_bytes(href)
-                images.append(
-                    OpenDocumentImage(
-                        href=href,
-                        name=name or href.split("/")[-1],
-                        content_type=guess_content_type(href),
-                        data=io.BytesIO(img_data),
-                        size_bytes=len(img_data),
-                        width=width,
-                        height=height,
-                        image_index=image_counter,
-                        caption=caption,
-                        description=description,
-                        unit_name=None,
-                    )
-                )
-            else:
-                images.append(
-                    OpenDocumentImage(
-                        href=href,
-                        name=name or href,
-                        width=width,
-                        height=height,
-                        image_index=image_counter,
-                        caption=caption,
-                        description=description,
-                        unit_name=None,
-                    )
+            size_bytes = ctx.file_size(href)
+            # Decompressed only when the image bytes are consumed
+            loader = ctx.member_loader(href)
+        except KeyError:
+            images.append(
+                OpenDocumentImage(
+                    href=href,
+                    name=name or href,
+                    width=width,
+                    height=height,
+                    image_index=image_counter,
+                    caption=caption,
+                    description=description,
+                    unit_name=None,
                 )
+            )
+            continue
         except Exception as exc:
             images.append(
                 OpenDocumentImage(
@@ -191,10 +233,52 @@ def _extract_images(
                     unit_name=None,
                 )
             )
+            continue
+
+        image = OpenDocumentImage(
+            href=href,
+            name=name or href.split("/")[-1],
+            content_type=guess_content_type(href),
+            size_bytes=size_bytes,
+            width=width,
+            height=height,
+            image_index=image_counter,
+            caption=caption,
+            description=description,
+            unit_name=None,
+        )
+        image.set_data_loader(loader)
+        images.append(image)
 
     return images
 
 
+def _extract_drawing(ctx: ZipContext) -> tuple[str, list[OpenDocumentImage]]:
+    """
+    Stream content.xml and return the drawing's full text and images.
+
+    Text and images are taken from each top-level paragraph/frame as soon as
+    it has been parsed. Kept separate from read_odg so that the parser, its
+    root element and the raw content.xml bytes are released on return rather
+    than staying referenced by the suspended generator.
+    """
+    lines: list[str] = []
+    images: list[OpenDocumentImage] = []
+    processed_hrefs: set[str] = set()
+    events = ctx.iterparse_xml("content.xml", events=("start", "end"))
+    for unit in _iter_drawing_units(events):
+        lines.extend(
+            text_block_lines(
+                unit,
+                _get_text_recursive,
+                text_p_tag=_TEXT_P_TAG,
+                text_h_tag=_TEXT_H_TAG,
+            )
+        )
+        images.extend(_extract_images(ctx, unit, processed_hrefs, len(images)))
+    return "\n".join(lines).strip(), images
+
+
 def read_odg(
     file_like: io.BytesIO, path: str | None = None
 ) -> Generator[OdgContent, Any, None]:
@@ -206,22 +290,13 @@ def read_odg(
 
         ctx = ZipContext(file_like)
         try:
-            meta_root = (
-                ctx.read_xml_root("meta.xml") if ctx.exists("meta.xml") else None
-            )
-            content_root = (
-                ctx.read_xml_root("content.xml") if ctx.exists("content.xml") else None
-            )
-            if content_root is None:
+            if not ctx.exists("content.xml"):
                 raise ExtractionFailedError("Invalid ODG file: content.xml not found")
 
-            drawing = content_root.find(".//office:body/office:drawing", NS)
-            if drawing is None:
-                raise ExtractionFailedError("Invalid ODG file: drawing body not found")
-
-            metadata = _extract_metadata(meta_root)
-            full_text = _extract_full_text(drawing)
-            images = _extract_images(ctx, drawing)
+            metadata = _extract_metadata(
+                ctx.read_xml_root("meta.xml") if ctx.exists("meta.xml") else None
+            )
+            full_text, images = _extract_drawing(ctx)
         finally:
             ctx.close()
 
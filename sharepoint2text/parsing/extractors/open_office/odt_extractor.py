@@ -75,7 +75,8 @@ Known Limitations
 - Tracked changes (revisions) are not separately reported
 - Text boxes in drawings may not extract all content
 - Math formulas are not converted (extracted as-is)
-- Nested tables may not preserve complete structure
+- Nested tables are reported as separate tables; their text is not part of
+  the enclosing cell's text in OdtTable data
 - Password-protected files are not supported
 - Form controls are not extracted
 
@@ -107,7 +108,7 @@ Maintenance Notes
 
 import io
 import logging
-from typing import Any, Generator
+from typing import Any, Generator, Iterator
 from xml.etree import ElementTree as ET
 
 from sharepoint2text.parsing.exceptions import (
@@ -133,55 +134,61 @@ from sharepoint2text.parsing.extractors.open_office._shared import (
     extract_odf_metadata,
     guess_content_type,
 )
-from sharepoint2text.parsing.extractors.util.encryption import is_odf_encrypted
 from sharepoint2text.parsing.extractors.util.zip_context import ZipContext
 
 logger = logging.getLogger(__name__)
 
 
+def _as_bytes_buffer(file_like: io.IOBase) -> io.BytesIO:
+    """Return an in-memory buffer so ZIP member reads never hit the source stream.
+
+    zipfile issues many small seeks and reads; on network- or disk-backed
+    streams each of those is a system call. BytesIO inputs are used as-is.
+    """
+    if isinstance(file_like, io.BytesIO):
+        return file_like
+    file_like.seek(0)
+    return io.BytesIO(file_like.read())
+
+
 class _OdtContext(ZipContext):
     """
     Cached context for ODT extraction.
 
     Opens the ZIP file once and caches all parsed XML documents.
-    This avoids repeatedly parsing the same XML files.
+    This avoids repeatedly parsing the same XML files. XML parts are parsed
+    on first access so the encryption check can run against the same open
+    archive before any (possibly encrypted) XML is touched.
     """
 
     def __init__(self, file_like: io.BytesIO):
-        """Initialize the ODT context and cache XML content."""
+        """Initialize the ODT context over a single in-memory ZIP archive."""
         super().__init__(file_like)
 
         # Cache for parsed XML roots
-        self._content_root: ET.Element | None = None
-        self._meta_root: ET.Element | None = None
-        self._styles_root: ET.Element | None = None
-
-        # Parse content.xml
-        if "content.xml" in self.namelist:
-            self._content_root = self.read_xml_root("content.xml")
+        self._roots: dict[str, ET.Element | None] = {}
 
-        # Parse meta.xml
-        if "meta.xml" in self.namelist:
-            self._meta_root = self.read_xml_root("meta.xml")
-
-        # Parse styles.xml
-        if "styles.xml" in self.namelist:
-            self._styles_root = self.read_xml_root("styles.xml")
+    def _cached_root(self, path: str) -> ET.Element | None:
+        if path not in self._roots:
+            self._roots[path] = (
+                self.read_xml_root(path) if path in self.namelist else None
+            )
+        return self._roots[path]
 
     @property
     def content_root(self) -> ET.Element | None:
         """Get cached content.xml root."""
-        return self._content_root
+        return self._cached_root("content.xml")
 
     @property
     def meta_root(self) -> ET.Element | None:
         """Get cached meta.xml root."""
-        return self._meta_root
+        return self._cached_root("meta.xml")
 
     @property
     def styles_root(self) -> ET.Element | None:
         """Get cached styles.xml root."""
-        return self._styles_root
+        return self._cached_root("styles.xml")
 
     def open_file(self, path: str) -> io.BufferedReader:
         """Open a file from the ZIP archive."""
@@ -216,6 +223,13 @@ _TEXT_SEQUENCE_TAG = f"{{{NS['text']}}}sequence"
 _TABLE_TABLE_TAG = f"{{{NS['table']}}}table"
 _TABLE_ROW_TAG = f"{{{NS['table']}}}table-row"
 _TABLE_CELL_TAG = f"{{{NS['table']}}}table-cell"
+_TABLE_ROW_GROUP_TAGS = frozenset(
+    {
+        f"{{{NS['table']}}}table-header-rows",
+        f"{{{NS['table']}}}table-rows",
+        f"{{{NS['table']}}}table-row-group",
+    }
+)
 _TEXT_LIST_TAG = f"{{{NS['text']}}}list"
 _TEXT_LIST_ITEM_TAG = f"{{{NS['text']}}}list-item"
 _TEXT_BOOKMARK_TAG = f"{{{NS['text']}}}bookmark"
@@ -263,8 +277,14 @@ def _extract_metadata_from_context(ctx: _OdtContext) -> OpenDocumentMetadata:
     return extract_odf_metadata(ctx.meta_root, NS)
 
 
-def _extract_paragraphs(body: ET.Element) -> list[OdtParagraph]:
-    """Extract paragraphs from the document body."""
+def _extract_paragraphs(
+    body: ET.Element, text_cache: dict[ET.Element, str] | None = None
+) -> list[OdtParagraph]:
+    """Extract paragraphs from the document body.
+
+    If ``text_cache`` is given, each paragraph's text is recorded in it so the
+    full-text pass can reuse it instead of walking the subtree again.
+    """
     logger.debug("Extracting ODT paragraphs")
     paragraphs = []
 
@@ -273,6 +293,8 @@ def _extract_paragraphs(body: ET.Element) -> list[OdtParagraph]:
         tag = elem.tag
         if tag in (_TEXT_P_TAG, _TEXT_H_TAG):
             text = _get_text_recursive(elem)
+            if text_cache is not None:
+                text_cache[elem] = text
             style_name = elem.get(_ATTR_TEXT_STYLE_NAME)
             outline_level = None
 
@@ -303,24 +325,62 @@ def _extract_paragraphs(body: ET.Element) -> list[OdtParagraph]:
     return paragraphs
 
 
-def _extract_tables(body: ET.Element) -> list[OdtTable]:
-    """Extract tables from the document body."""
-    logger.debug("Extracting ODT tables")
-    tables = []
+def _iter_table_rows(table: ET.Element) -> Iterator[ET.Element]:
+    """Yield the rows of a table without descending into nested tables.
+
+    Rows are direct children of table:table or of its row grouping elements
+    (table:table-header-rows, table:table-rows, table:table-row-group).
+    """
+    for child in table:
+        tag = child.tag
+        if tag == _TABLE_ROW_TAG:
+            yield child
+        elif tag in _TABLE_ROW_GROUP_TAGS:
+            yield from _iter_table_rows(child)
+
+
+def _iter_cell_paragraphs(cell: ET.Element) -> Iterator[ET.Element]:
+    """Yield paragraphs of a table cell, skipping those of nested tables.
+
+    Nested tables are reported as tables of their own.
+    """
+    for child in cell:
+        tag = child.tag
+        if tag == _TEXT_P_TAG:
+            yield from child.iter(_TEXT_P_TAG)
+        elif tag != _TABLE_TABLE_TAG:
+            yield from _iter_cell_paragraphs(child)
+
 
-    for table in body.iter(_TABLE_TABLE_TAG):
-        table_data: list[list[str]] = []
-        for row in table.iter(_TABLE_ROW_TAG):
-            row_data = []
-            for cell in row.findall(_TABLE_CELL_TAG):
-                cell_texts = [_get_text_recursive(p) for p in cell.iter(_TEXT_P_TAG)]
-                row_data.append("\n".join(cell_texts))
-            if row_data:
-                table_data.append(row_data)
-        if table_data:
-            tables.append(OdtTable(data=table_data))
+def _extract_tables(
+    body: ET.Element, text_cache: dict[ET.Element, str] | None = None
+) -> list[OdtTable]:
+    """Extract tables from the document body.
 
-    return tables
+    Cell paragraph texts are taken from ``text_cache`` when available.
+    """
+    logger.debug("Extracting ODT tables")
+    cache = text_cache or {}
+
+    def paragraph_text(p: ET.Element) -> str:
+        text = cache.get(p)
+        return _get_text_recursive(p) if text is None else text
+
+    tables_data = [
+        [
+            row_data
+            for row_data in (
+                [
+                    "\n".join(map(paragraph_text, _iter_cell_paragraphs(cell)))
+                    for cell in row.iterfind(_TABLE_CELL_TAG)
+                ]
+                for row in _iter_table_rows(table)
+            )
+            if row_data
+        ]
+        for table in body.iter(_TABLE_TABLE_TAG)
+    ]
+    return [OdtTable(data=table_data) for table_data in tables_data if table_data]
 
 
 def _extract_hyperlinks(body: ET.Element) -> list[OdtHyperlink]:
@@ -683,43 +743,46 @@ def _extract_styles_from_context(ctx: _OdtContext) -> list[str]:
     return list(styles)
 
 
-def _append_full_text_from_element(elem: ET.Element, output: list[str]) -> None:
-    """Append text from an element to output in document order."""
-    tag = elem.tag
+def _iter_full_text_paragraphs(body: ET.Element) -> Iterator[ET.Element]:
+    """Yield the paragraphs that make up the full text, in document order."""
+    stack = [body]
+    while stack:
+        elem = stack.pop()
+        tag = elem.tag
 
-    if tag in (_TEXT_P_TAG, _TEXT_H_TAG):
-        text = _get_text_recursive(elem)
-        if text.strip():
-            output.append(text)
-        return
-
-    if tag == _TABLE_TABLE_TAG:
-        for row in elem.iter(_TABLE_ROW_TAG):
-            for cell in row.findall(_TABLE_CELL_TAG):
-                for p in cell.iter(_TEXT_P_TAG):
-                    text = _get_text_recursive(p)
-                    if text.strip():
-                        output.append(text)
-        return
-
-    if tag == _TEXT_LIST_TAG:
-        for item in elem.iter(_TEXT_LIST_ITEM_TAG):
-            for p in item.iter(_TEXT_P_TAG):
-                text = _get_text_recursive(p)
-                if text.strip():
-                    output.append(text)
-        return
-
-    for child in elem:
-        _append_full_text_from_element(child, output)
-
-
-def _extract_full_text(body: ET.Element) -> str:
-    """Extract full text from the document body in reading order."""
+        if tag in (_TEXT_P_TAG, _TEXT_H_TAG):
+            yield elem
+        elif tag == _TABLE_TABLE_TAG:
+            for row in _iter_table_rows(elem):
+                for cell in row.findall(_TABLE_CELL_TAG):
+                    yield from cell.iter(_TEXT_P_TAG)
+        elif tag == _TEXT_LIST_TAG:
+            for item in elem.iter(_TEXT_LIST_ITEM_TAG):
+                yield from item.iter(_TEXT_P_TAG)
+        else:
+            stack.extend(reversed(elem))
+
+
+def _extract_full_text(
+    body: ET.Element, text_cache: dict[ET.Element, str] | None = None
+) -> str:
+    """Extract full text from the document body in reading order.
+
+    Paragraph texts already computed by ``_extract_paragraphs`` are taken from
+    ``text_cache``; the result is written straight into a single buffer.
+    """
     logger.debug("Extracting ODT full text")
-    all_text: list[str] = []
-    _append_full_text_from_element(body, all_text)
-    return "\n".join(all_text)
+    cache = text_cache or {}
+    buffer = io.StringIO()
+    for elem in _iter_full_text_paragraphs(body):
+        text = cache.get(elem)
+        if text is None:
+            text = _get_text_recursive(elem)
+        if text.strip():
+            if buffer.tell():
+                buffer.write("\n")
+            buffer.write(text)
+    return buffer.getvalue()
 
 
 def read_odt(
@@ -769,17 +832,24 @@ def read_odt(
         ...         print(f"Images: {len(doc.images)}")
 
     Performance Notes:
-        - ZIP file is opened once and all XML is cached
+        - ZIP file is opened once (including the encryption check) and all
+          XML is cached
+        - Non-BytesIO inputs are buffered into memory once up front
         - content.xml and styles.xml are parsed once and reused
+        - Paragraph text is computed once and shared with full_text
+        - ZIP member CRC32 checks are kept: zipfile runs them through zlib and
+          they cost well under 1% of the XML parse for large content.xml
     """
     try:
-        file_like.seek(0)
-        if is_odf_encrypted(file_like):
-            raise ExtractionFileEncryptedError("ODT is encrypted or password-protected")
-
-        # Create context and load all XML files once
-        ctx = _OdtContext(file_like)
+        # Open the archive once; the encryption check and all XML/image reads
+        # share the same parsed central directory.
+        ctx = _OdtContext(_as_bytes_buffer(file_like))
         try:
+            if ctx.is_odf_encrypted():
+                raise ExtractionFileEncryptedError(
+                    "ODT is encrypted or password-protected"
+                )
+
             # Validate content.xml exists
             if ctx.content_root is None:
                 raise ExtractionFailedError("Invalid ODT file: content.xml not found")
@@ -793,8 +863,9 @@ def read_odt(
             metadata = _extract_metadata_from_context(ctx)
 
             # Extract content from body
-            paragraphs = _extract_paragraphs(body)
-            tables = _extract_tables(body)
+            paragraph_texts: dict[ET.Element, str] = {}
+            paragraphs = _extract_paragraphs(body, paragraph_texts)
+            tables = _extract_tables(body, paragraph_texts)
             hyperlinks = _extract_hyperlinks(body)
             footnotes, endnotes = _extract_notes(body)
             annotations = _extract_annotations(body)
@@ -802,7 +873,7 @@ def read_odt(
             images = _extract_images_from_context(ctx, body)
             headers, footers = _extract_headers_footers_from_context(ctx)
             styles = _extract_styles_from_context(ctx)
-            full_text = _extract_full_text(body)
+            full_text = _extract_full_text(body, paragraph_texts)
         finally:
             ctx.close()
 
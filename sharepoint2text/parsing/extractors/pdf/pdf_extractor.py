@@ -88,6 +88,13 @@ Usage
     ...         for page_num, page in enumerate(doc.pages, start=1):
     ...             print(f"Page {page_num}: {len(page.text)} chars, {len(page.images)} images")
 
+Large files on disk can be memory-mapped instead of read into memory:
+
+    >>> from sharepoint2text.parsing.extractors.pdf.pdf_extractor import read_pdf_path
+    >>>
+    >>> for doc in read_pdf_path("large-report.pdf"):
+    ...     print(f"Pages: {doc.metadata.total_pages}")
+
 See Also
 --------
 - pypdf documentation: https://pypdf.readthedocs.io/
@@ -96,26 +103,41 @@ See Also
 Maintenance Notes
 -----------------
 - pypdf handles most PDF quirks internally
-- Image extraction accesses raw XObject data
+- Image extraction accesses raw XObject data; streams are decoded on first
+  access of PdfImage.data, so unread images cost no decompression (the image
+  keeps the document alive until then)
 - Failed image extractions are logged and skipped (not raised)
 - Color space reported as string for debugging
 - Format detection based on compression filter type
+- Each page content stream is parsed once and shared by text extraction and
+  the MCID walk (image order/captions)
 """
 
 import calendar
+import codecs
 import contextlib
+import functools
+import hashlib
 import io
+import itertools
 import logging
+import mmap
+import os
 import re
 import statistics
 import string
 import struct
+import threading
 import unicodedata
-from typing import Any, Callable, Generator, Iterable, Optional, Protocol
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Container, Generator, Iterable, Optional, Protocol
 
 from pypdf import PdfReader
+from pypdf._codecs import _pdfdoc_encoding
 from pypdf.errors import DependencyError
-from pypdf.generic import ContentStream
+from pypdf.generic import ContentStream, NameObject, create_string_object
 
 from sharepoint2text.parsing.exceptions import (
     ExtractionError,
@@ -137,26 +159,12 @@ logger = logging.getLogger(__name__)
 # PERFORMANCE OPTIMIZATION: Font analysis cache to avoid repeated TTF parsing
 _FONT_CACHE: dict[bytes, Optional[tuple[int, dict[int, tuple[int, int]]]]] = {}
 
-# PERFORMANCE OPTIMIZATION: Pre-compiled regex patterns for better performance
-_DATE_HEADER_PATTERN = re.compile(r"\d{2}/\d{2}/\d{4}")
-_MONTH_PATTERN = re.compile(
-    r"\b(January|February|March|April|May|June|July|August|"
-    r"September|October|November|December)\b",
-    re.IGNORECASE,
-)
-_NUMERIC_RE = re.compile(r"\d")
-_TRAILING_NUMBER_RE = re.compile(r"([\d.,]+)$")
-_TRAILING_NUMBER_BLOCK_RE = re.compile(r"[\d.,]+$")
-_LINE_NUMBER_PREFIX_RE = re.compile(r"^\d+\.")
-_SECTION_BREAK_RE = re.compile(r"[.;:]")
-_NON_UNIT_CHARS_RE = re.compile(r"[^A-Za-z\\s&]")
-_DASH_RANGE_RE = re.compile(r"[\u2010-\u2013\u2212]")
-_WHITESPACE_RE = re.compile(r"\s+")
-
 # =============================================================================
 # Type Aliases
 # =============================================================================
 TableRows = list[list[str]]
+# In-memory PDF data, or a read-only memory map of a PDF file (read_pdf_path)
+PdfSource = io.BytesIO | mmap.mmap
 TextSegment = tuple[float, float, str, float]  # (y, x, text, font_size)
 
 # Reference digit bounding boxes (width, height) for a common sans font.
@@ -198,8 +206,68 @@ FILTER_TO_CONTENT_TYPE: dict[str, str] = {
     "/LZWDecode": "image/png",
 }
 
+# Both mappings resolved with a single lookup per image
+_IMAGE_TYPE_BY_FILTER: dict[str, tuple[str, str]] = {
+    filter_name: (FILTER_TO_FORMAT[filter_name], content_type)
+    for filter_name, content_type in FILTER_TO_CONTENT_TYPE.items()
+}
+_UNKNOWN_IMAGE_TYPE = ("raw", "image/unknown")
+
+_JPEG_ONLY_FILTER_CHAIN = ("/DCTDecode",)
+
+# Filters that pypdf's get_data() fully undoes; only these may precede the
+# image codec in a filter chain (e.g. [/FlateDecode /DCTDecode] yields JPEG)
+_TRANSPORT_FILTERS = frozenset(
+    {
+        "/ASCIIHexDecode",
+        "/ASCII85Decode",
+        "/LZWDecode",
+        "/FlateDecode",
+        "/RunLengthDecode",
+        "/Crypt",
+    }
+)
+
+# Image XObject keys holding alt text, in order of preference
+_IMAGE_CAPTION_KEYS = ("/Alt", "/Title", "/Caption", "/TU")
+_IMAGE_CAPTION_KEY_SET = frozenset(_IMAGE_CAPTION_KEYS)
+
 _AES_FALLBACK_IMAGE_SKIP_THRESHOLD_BYTES = 10 * 1024 * 1024
 
+# Recently opened documents, keyed by a digest of their bytes, so re-reading
+# the same PDF reuses pypdf's parsed xref and resolved objects. Bounded in
+# count and document size to keep the retained memory small.
+_READER_CACHE_SIZE = 4
+_READER_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_READER_CACHE: OrderedDict[bytes, tuple[PdfReader, bool, threading.Lock]] = (
+    OrderedDict()
+)
+_READER_CACHE_LOCK = threading.Lock()
+
+# Content stream operators as produced by pypdf's ContentStream (raw bytes)
+_OP_BDC = b"BDC"
+_OP_BMC = b"BMC"
+_OP_EMC = b"EMC"
+_OP_DO = b"Do"
+_OP_TJ = b"Tj"
+_OP_TJ_ARRAY = b"TJ"
+_OP_NEXT_LINE_SHOW = b"'"
+_OP_NEXT_LINE_SPACED_SHOW = b'"'
+
+# Sentinel for single-probe dictionary lookups
+_MISSING = object()
+
+# PDFDocEncoding as C-level translation tables (see _decode_pdf_string)
+_PDFDOC_UNDEFINED_BYTES = bytes(
+    code for code, char in enumerate(_pdfdoc_encoding) if char == "\u0000"
+)
+_PDFDOC_FROM_LATIN1 = {
+    code: char
+    for code, char in enumerate(_pdfdoc_encoding)
+    if char != chr(code) and char != "\u0000"
+}
+_UTF16_BOMS = (codecs.BOM_UTF16_BE, codecs.BOM_UTF16_LE)
+
 
 class PageLike(Protocol):
     def extract_text(self, *args: Any, **kwargs: Any) -> str: ...
@@ -212,7 +280,7 @@ class PageLike(Protocol):
     def pdf(self) -> Any: ...
 
 
-def _open_pdf_reader(file_like: io.BytesIO) -> PdfReader:
+def _open_pdf_reader(file_like: PdfSource) -> PdfReader:
     file_like.seek(0)
     try:
         return PdfReader(file_like)
@@ -225,7 +293,7 @@ def _open_pdf_reader(file_like: io.BytesIO) -> PdfReader:
         return PdfReader(file_like)
 
 
-def _should_skip_images(reader: PdfReader, file_like: io.BytesIO) -> bool:
+def _should_skip_images(reader: PdfReader, file_like: PdfSource) -> bool:
     if not reader.is_encrypted:
         return False
     try:
@@ -235,7 +303,10 @@ def _should_skip_images(reader: PdfReader, file_like: io.BytesIO) -> bool:
     if providers.crypt_provider[0] != "local_crypt_fallback":
         return False
     try:
-        data_size = file_like.getbuffer().nbytes
+        if isinstance(file_like, mmap.mmap):
+            data_size = len(file_like)
+        else:
+            data_size = file_like.getbuffer().nbytes
     except Exception:
         return False
     return data_size >= _AES_FALLBACK_IMAGE_SKIP_THRESHOLD_BYTES
@@ -526,8 +597,272 @@ def _patched_build_char_map() -> Iterable[None]:
             setattr(module, func_name, original)
 
 
+def _extract_page(
+    page: PageLike,
+    page_num: int,
+    skip_images: bool,
+    skip_text: bool = False,
+    reader_lock: Optional[threading.Lock] = None,
+) -> PdfPage:
+    """
+    Extract text, tables and images of a single page.
+
+    reader_lock is the lock guarding the page's reader (see _open_document);
+    deferred image decoding acquires it, as it runs after extraction.
+    """
+    if skip_images and skip_text:
+        return PdfPage()
+    content = _parse_page_content(page)
+    images = (
+        []
+        if skip_images
+        else _extract_image_bytes(page, page_num, content, reader_lock)
+    )
+    if skip_text:
+        # Tables are derived from the page text, so they are skipped as well
+        return PdfPage(images=images)
+    with _shared_page_content(page, content):
+        page_text, spatial_lines = _extract_text_with_spacing(page)
+    raw_lines = page_text.splitlines()
+    raw_tables = _TableExtractor.extract(raw_lines)
+    if spatial_lines == raw_lines:
+        # Spatial extraction fell back to the plain text; same lines, same tables
+        tables = raw_tables
+    else:
+        spatial_tables = _TableExtractor.extract(spatial_lines)
+        tables = _TableExtractor.choose_tables(raw_tables, spatial_tables)
+    return PdfPage(
+        text=page_text,
+        images=images,
+        tables=tables,
+    )
+
+
+def _parse_page_content(page: PageLike) -> Optional[ContentStream]:
+    """
+    Parse the page content stream once, the way pypdf's text extraction does.
+
+    String operands are kept as raw bytes ("bytes" encoding) so that
+    ``page.extract_text`` can reuse the parsed operations unchanged; the MCID
+    walk re-decodes them via ``_as_text_object``.
+    """
+    contents = page.get("/Contents")
+    if contents is None:
+        return None
+    try:
+        return ContentStream(contents.get_object(), page.pdf, "bytes")
+    except Exception as e:
+        logger.debug("Failed to parse content stream: %s", e)
+        return None
+
+
+@contextlib.contextmanager
+def _shared_page_content(
+    page: PageLike, content: Optional[ContentStream]
+) -> Generator[None, None, None]:
+    """
+    Temporarily expose an already parsed content stream as the page /Contents.
+
+    pypdf's ``extract_text`` reuses a /Contents entry that already is a
+    ContentStream instead of decoding and tokenizing the stream again.
+    """
+    if content is None:
+        yield
+        return
+    key = NameObject("/Contents")
+    original = dict.get(page, key)  # raw entry, keeps indirect references
+    page[key] = content
+    try:
+        yield
+    finally:
+        page[key] = original
+
+
+# Documents with fewer pages are always extracted in-process; starting a pool
+# costs more than it saves there.
+_MIN_POOL_PAGES = 3
+# Target number of page blocks handed to each worker (see _extract_pages_in_pool)
+_POOL_BLOCKS_PER_WORKER = 4
+
+
+def _resolve_page_workers(page_workers: int, total_pages: int) -> int:
+    """Number of pool workers to use; 1 means extract in-process."""
+    if total_pages < _MIN_POOL_PAGES:
+        return 1
+    if page_workers == 0:
+        page_workers = max(1, (os.cpu_count() or 1) - 1)
+    return max(1, min(page_workers, total_pages))
+
+
+# Per-process reader used by page pool workers (see _extract_pages_in_pool).
+_WORKER_READER: Optional[PdfReader] = None
+
+
+def _init_page_worker(pdf_bytes: bytes) -> None:
+    global _WORKER_READER
+    reader = _open_pdf_reader(io.BytesIO(pdf_bytes))
+    if reader.is_encrypted:
+        reader.decrypt("")
+    _WORKER_READER = reader
+
+
+def _extract_page_in_worker(
+    page_index: int, skip_images: bool, skip_text: bool
+) -> PdfPage:
+    if _WORKER_READER is None:
+        raise RuntimeError("PDF page worker was not initialized")
+    page = _WORKER_READER.pages[page_index]
+    return _extract_page(page, page_index + 1, skip_images, skip_text)
+
+
+def _extract_pages_in_pool(
+    file_like: PdfSource,
+    total_pages: int,
+    skip_images: bool,
+    skip_text: bool,
+    page_workers: int,
+) -> list[PdfPage]:
+    """
+    Extract pages across a process pool.
+
+    Each worker opens its own PdfReader from the raw bytes once; pages are
+    submitted in contiguous blocks to keep IPC overhead low, and results are
+    collected in page order.
+    """
+    workers = page_workers
+    chunksize = max(1, total_pages // (workers * _POOL_BLOCKS_PER_WORKER))
+    logger.debug(
+        "Extracting %d PDF pages with %d workers (blocks of %d)",
+        total_pages,
+        workers,
+        chunksize,
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_page_worker,
+        # Workers open their own reader; a memory map is copied once to pickle
+        initargs=(
+            file_like[:] if isinstance(file_like, mmap.mmap) else file_like.getvalue(),
+        ),
+    ) as executor:
+        return list(
+            executor.map(
+                _extract_page_in_worker,
+                range(total_pages),
+                itertools.repeat(skip_images),
+                itertools.repeat(skip_text),
+                chunksize=chunksize,
+            )
+        )
+
+
+def _open_document(
+    file_like: PdfSource,
+) -> tuple[PdfReader, bool, threading.Lock]:
+    """
+    Open a PDF, reusing a cached reader for recently seen documents.
+
+    Returns the reader, whether images must be skipped, and a lock that must
+    be held while pages are extracted (a cached reader may be shared between
+    threads, and pypdf readers are not thread-safe).
+    """
+    try:
+        data = file_like.getvalue()
+    except Exception:
+        # e.g. memory-mapped files, which are opened in place
+        data = None
+    if data is None or len(data) > _READER_CACHE_MAX_BYTES:
+        reader, skip_images = _open_and_decrypt(file_like)
+        return reader, skip_images, threading.Lock()
+
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    with _READER_CACHE_LOCK:
+        cached = _READER_CACHE.get(key)
+        if cached is not None:
+            _READER_CACHE.move_to_end(key)
+            return cached
+
+    # Private buffer: the caller may reuse or mutate its own BytesIO
+    reader, skip_images = _open_and_decrypt(io.BytesIO(data))
+    entry = (reader, skip_images, threading.Lock())
+    with _READER_CACHE_LOCK:
+        entry = _READER_CACHE.setdefault(key, entry)
+        while len(_READER_CACHE) > _READER_CACHE_SIZE:
+            _READER_CACHE.popitem(last=False)
+    return entry
+
+
+def _open_and_decrypt(file_like: PdfSource) -> tuple[PdfReader, bool]:
+    """Open and decrypt a PDF; also report whether images must be skipped."""
+    reader = _open_pdf_reader(file_like)
+    if reader.is_encrypted:
+        try:
+            decrypt_result = reader.decrypt("")
+        except Exception:
+            decrypt_result = 0
+        if decrypt_result == 0:
+            raise ExtractionFileEncryptedError("PDF is encrypted or password-protected")
+
+    skip_images = _should_skip_images(reader, file_like)
+    if skip_images:
+        logger.info(
+            "Skipping image extraction for large AES-encrypted PDF using fallback crypto"
+        )
+    return reader, skip_images
+
+
+def iterate_pdf_pages(
+    file_like: PdfSource,
+    *,
+    extract_text: bool = True,
+    extract_images: bool = True,
+) -> Generator[PdfPage, Any, None]:
+    """
+    Extract a PDF page by page.
+
+    Unlike read_pdf, which collects every page (including decoded image
+    bytes) into one PdfContent, this yields each PdfPage as soon as it is
+    extracted. Pages the caller has finished with can be garbage collected,
+    so peak memory is bounded by the largest page rather than the document.
+
+    Args:
+        file_like: BytesIO object containing the complete PDF file data, or
+            a read-only memory map of a PDF file.
+        extract_text: See read_pdf.
+        extract_images: See read_pdf.
+
+    Yields:
+        PdfPage: One object per page, in document order.
+
+    Raises:
+        ExtractionFileEncryptedError: If the PDF requires a password.
+        ExtractionFailedError: If the PDF cannot be parsed.
+    """
+    try:
+        reader, skip_images, reader_lock = _open_document(file_like)
+        skip_images = skip_images or not extract_images
+        with reader_lock:
+            page_objects = list(reader.pages)
+        for page_num, page in enumerate(page_objects, start=1):
+            # Never hold the lock across a yield
+            with reader_lock:
+                pdf_page = _extract_page(
+                    page, page_num, skip_images, not extract_text, reader_lock
+                )
+            yield pdf_page
+    except ExtractionError:
+        raise
+    except Exception as exc:
+        raise ExtractionFailedError("Failed to extract PDF file", cause=exc) from exc
+
+
 def read_pdf(
-    file_like: io.BytesIO, path: Optional[str] = None
+    file_like: PdfSource,
+    path: Optional[str] = None,
+    *,
+    page_workers: int = 1,
+    extract_text: bool = True,
+    extract_images: bool = True,
 ) -> Generator[PdfContent, Any, None]:
     """
     Extract all relevant content from a PDF file.
@@ -540,11 +875,23 @@ def read_pdf(
     extractors, even though PDF files contain exactly one document.
 
     Args:
-        file_like: BytesIO object containing the complete PDF file data.
+        file_like: BytesIO object containing the complete PDF file data, or
+            a read-only memory map of a PDF file (see read_pdf_path).
             The stream position is reset to the beginning before reading.
         path: Optional filesystem path to the source file. If provided,
             populates file metadata (filename, extension, folder) in the
             returned PdfContent.metadata.
+        page_workers: Number of worker processes for per-page extraction.
+            The default of 1 extracts pages in the calling process. Larger
+            values fan pages out to a ProcessPoolExecutor, which pays off for
+            long documents on multi-core hosts. 0 uses ``os.cpu_count() - 1``
+            workers (at least 1). Documents with fewer than three pages are
+            always extracted in-process. Process pools are not available on every
+            platform (e.g. some serverless runtimes).
+        extract_text: Set to False to skip text (and the tables derived from
+            it) when only images are needed; pages then have empty text.
+        extract_images: Set to False to skip image extraction when only text
+            is needed; pages then have no images.
 
     Yields:
         PdfContent: Single PdfContent object containing:
@@ -552,6 +899,10 @@ def read_pdf(
             - metadata: PdfMetadata with total_pages and file info
 
     Note:
+        Use iterate_pdf_pages() to process large PDFs page by page without
+        holding every page in memory at once, and read_pdf_path() to read a
+        PDF from disk without copying the file into memory.
+
         Scanned PDFs containing only images will yield pages with empty
         text strings. OCR is not performed. For scanned documents, the
         images are still extracted and could be processed separately.
@@ -568,50 +919,34 @@ def read_pdf(
         ...             print(f"  Images: {len(page.images)}")
     """
     try:
-        reader = _open_pdf_reader(file_like)
-        if reader.is_encrypted:
-            try:
-                decrypt_result = reader.decrypt("")
-            except Exception:
-                decrypt_result = 0
-            if decrypt_result == 0:
-                raise ExtractionFileEncryptedError(
-                    "PDF is encrypted or password-protected"
+        reader, skip_images, reader_lock = _open_document(file_like)
+        skip_images = skip_images or not extract_images
+        skip_text = not extract_text
+        with reader_lock:
+            # reader.pages is a lazy view; resolve the page tree once.
+            page_objects = list(reader.pages)
+            total_pages = len(page_objects)
+            logger.debug("Parsing PDF with %d pages", total_pages)
+
+            workers = _resolve_page_workers(page_workers, total_pages)
+            if workers > 1:
+                pages = _extract_pages_in_pool(
+                    file_like, total_pages, skip_images, skip_text, workers
                 )
-        logger.debug("Parsing PDF with %d pages", len(reader.pages))
-
-        skip_images = _should_skip_images(reader, file_like)
-        if skip_images:
-            logger.info(
-                "Skipping image extraction for large AES-encrypted PDF using fallback crypto"
-            )
-
-        pages = []
-        total_images = 0
-        total_tables = 0
-        for page_num, page in enumerate(reader.pages, start=1):
-            images = [] if skip_images else _extract_image_bytes(page, page_num)
-            total_images += len(images)
-            page_text, spatial_lines = _extract_text_with_spacing(page)
-            raw_lines = page_text.splitlines()
-            raw_tables = _TableExtractor.extract(raw_lines)
-            spatial_tables = _TableExtractor.extract(spatial_lines)
-            tables = _TableExtractor.choose_tables(raw_tables, spatial_tables)
-            total_tables += len(tables)
-            pages.append(
-                PdfPage(
-                    text=page_text,
-                    images=images,
-                    tables=tables,
-                )
-            )
-
-        metadata = PdfMetadata(total_pages=len(reader.pages))
+            else:
+                pages = [
+                    _extract_page(page, page_num, skip_images, skip_text, reader_lock)
+                    for page_num, page in enumerate(page_objects, start=1)
+                ]
+        total_images = sum(len(page.images) for page in pages)
+        total_tables = sum(len(page.tables) for page in pages)
+
+        metadata = PdfMetadata(total_pages=total_pages)
         metadata.populate_from_path(path)
 
         logger.info(
             "Extracted PDF: %d pages, %d images, %d tables",
-            len(reader.pages),
+            total_pages,
             total_images,
             total_tables,
         )
@@ -626,7 +961,56 @@ def read_pdf(
         raise ExtractionFailedError("Failed to extract PDF file", cause=exc) from exc
 
 
-def _extract_image_bytes(page: PageLike, page_num: int) -> list[PdfImage]:
+def read_pdf_path(
+    path: str | os.PathLike[str],
+    *,
+    page_workers: int = 1,
+    extract_text: bool = True,
+    extract_images: bool = True,
+) -> Generator[PdfContent, Any, None]:
+    """
+    Extract a PDF file from disk without reading it into memory first.
+
+    The file is memory-mapped read-only, so pypdf reads the parts it needs
+    from the OS page cache instead of a full in-memory copy of the file.
+    The map is not closed explicitly: extracted images decode their data
+    lazily from the document and keep the map alive as long as needed.
+
+    Args:
+        path: Filesystem path to the PDF file.
+        page_workers: See read_pdf.
+        extract_text: See read_pdf.
+        extract_images: See read_pdf.
+
+    Yields:
+        PdfContent: See read_pdf.
+
+    Raises:
+        ExtractionFileEncryptedError: If the PDF requires a password.
+        ExtractionFailedError: If the PDF cannot be parsed.
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(path, "rb") as f:
+        try:
+            source: PdfSource = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; let read_pdf report them
+            source = io.BytesIO(f.read())
+    yield from read_pdf(
+        source,
+        path=os.fspath(path),
+        page_workers=page_workers,
+        extract_text=extract_text,
+        extract_images=extract_images,
+    )
+
+
+def _extract_image_bytes(
+    page: PageLike,
+    page_num: int,
+    content: Optional[ContentStream],
+    reader_lock: Optional[threading.Lock] = None,
+) -> list[PdfImage]:
     """
     Extract all images from a PDF page's XObject resources.
 
@@ -637,6 +1021,9 @@ def _extract_image_bytes(page: PageLike, page_num: int) -> list[PdfImage]:
     Args:
         page: A pypdf PageObject to extract images from.
         page_num: 1-based page number for image metadata.
+        content: The page content stream parsed by ``_parse_page_content``.
+        reader_lock: Lock guarding the page's reader, held while deferred
+            image data is decoded.
 
     Returns:
         List of PdfImage objects for successfully extracted images.
@@ -647,7 +1034,19 @@ def _extract_image_bytes(page: PageLike, page_num: int) -> list[PdfImage]:
         return []
 
     x_objects = resources["/XObject"].get_object()
-    image_occurrences, mcid_order, mcid_text = _extract_page_mcid_data(page)
+    # Resolve every XObject once and keep only images
+    image_objs: dict[Any, Any] = {}
+    for obj_name in x_objects:
+        obj = x_objects[obj_name]
+        if obj.get("/Subtype") == "/Image":
+            image_objs[obj_name] = obj
+    # Pages with only form XObjects (or none) need no MCID walk
+    if not image_objs:
+        return []
+
+    image_occurrences, mcid_order, mcid_index, mcid_text = _extract_page_mcid_data(
+        content
+    )
 
     # Build list of (obj_name, obj, caption) tuples to extract
     candidates: list[tuple[Any, Any, str]] = []
@@ -656,23 +1055,32 @@ def _extract_image_bytes(page: PageLike, page_num: int) -> list[PdfImage]:
         # Use MCID data for document order and captions
         for occurrence in image_occurrences:
             obj_name = occurrence["name"]
-            obj = x_objects.get(obj_name)
-            if obj is None or obj.get("/Subtype") != "/Image":
+            obj = image_objs.get(obj_name)
+            if obj is None:
                 continue
-            caption = _lookup_caption(occurrence.get("mcid"), mcid_order, mcid_text)
+            caption = _lookup_caption(
+                occurrence.get("mcid"), mcid_order, mcid_index, mcid_text
+            )
             candidates.append((obj_name, obj, caption))
     else:
         # Fall back to XObject dictionary order
-        for obj_name in x_objects:
-            obj = x_objects[obj_name]
-            if obj.get("/Subtype") == "/Image":
-                candidates.append((obj_name, obj, ""))
+        candidates = [(obj_name, obj, "") for obj_name, obj in image_objs.items()]
 
-    # Extract images from candidates
+    # Extract images from candidates; repeated draws of one XObject share
+    # a single decode of its stream
     found_images: list[PdfImage] = []
+    data_loaders: dict[Any, Callable[[], bytes]] = {}
     for image_index, (obj_name, obj, caption) in enumerate(candidates, start=1):
         try:
-            image_data = _extract_image(obj, obj_name, image_index, page_num, caption)
+            image_data = _extract_image(
+                obj,
+                obj_name,
+                image_index,
+                page_num,
+                caption,
+                data_loaders,
+                reader_lock,
+            )
             found_images.append(image_data)
         except Exception as e:
             logger.warning(
@@ -774,7 +1182,8 @@ def _extract_text_with_spacing(page: PageLike) -> tuple[str, list[str]]:
             parts.append(text)
             last_x = x
         line_text = "".join(parts)
-        line_texts.append(re.sub(r"\s+", " ", line_text).strip())
+        # Collapse whitespace runs; split() trims both ends as well
+        line_texts.append(" ".join(line_text.split()))
 
     if len(line_positions) < 2:
         return page_text, line_texts
@@ -873,14 +1282,25 @@ class _TableExtractor:
     TRAILING_NUMBER_RE = re.compile(r"([\d.,]+)$")
     TRAILING_NUMBER_BLOCK_RE = re.compile(r"[\d.,]+$")
     LINE_NUMBER_PREFIX_RE = re.compile(r"^\d+\.")
+    # Digits with thousands/decimal separators, at least one digit
+    NUMERIC_TOKEN_RE = re.compile(r"[\d,.]*\d[\d,.]*")
+    # Two decimals glued together by the PDF text layer, e.g. "1,234.56789.0"
+    NUMERIC_BLOB_RE = re.compile(r"^(\d[\d,]*\.\d)(\d[\d,]*\.\d+)$")
 
     # Text structure patterns
     SECTION_BREAK_RE = re.compile(r"[.;:]")
     NON_UNIT_CHARS_RE = re.compile(r"[^A-Za-z\\s&]")
+    TRAILING_DOUBLE_SPACE_RE = re.compile(r"\s{2,}$")
+    DOUBLE_SPACE_RE = re.compile(r"\s{2,}")
 
-    # Label normalization patterns (pre-compiled for speed)
-    DASH_RANGE_RE = re.compile(r"[\u2010-\u2013\u2212]")
-    WHITESPACE_RE = re.compile(r"\s+")
+    # Word analysis patterns
+    ALPHA_TOKEN_RE = re.compile(r"[A-Za-z]+")
+    NON_ALPHA_RE = re.compile(r"[^A-Za-z]")
+
+    # Label normalization: hyphens/dashes U+2010-U+2013 and minus U+2212
+    DASH_RANGE_TRANS = str.maketrans(
+        dict.fromkeys("\u2010\u2011\u2012\u2013\u2212", "-")
+    )
 
     # -------------------------------------------------------------------------
     # Extraction Configuration
@@ -894,6 +1314,9 @@ class _TableExtractor:
     def __init__(self, lines: list[str]) -> None:
         self.lines = [line.strip() for line in lines]
         self.known_words = self._collect_known_words(self.lines)
+        self._next_non_empty = self._index_next_non_empty(self.lines)
+        # Normalized labels by raw label; known_words is fixed per document
+        self._label_cache: dict[str, str] = {}
         self._spaced_value_columns = False
         # Parsing state
         self._current_rows: TableRows = []
@@ -933,6 +1356,10 @@ class _TableExtractor:
     # Core Extraction Logic
     # -------------------------------------------------------------------------
     def _extract(self) -> list[TableRows]:
+        if not self._has_digits():
+            # Every row-based table starts at a line with numbers; prose-only
+            # pages can only yield tables from the token-count fallback
+            return self._extract_tables_from_text_simple()
         tables: list[TableRows] = []
         pending_header_label = ""
         pending_header_unit = ""
@@ -1068,6 +1495,17 @@ class _TableExtractor:
         self._flush_current(tables, self._current_rows)
         return tables if tables else self._extract_tables_from_text_simple()
 
+    def _has_digits(self) -> bool:
+        """Check whether any line contains a digit (also after NFKC)."""
+        text = "\n".join(self.lines)
+        if self.NUMERIC_RE.search(text):
+            return True
+        if text.isascii():
+            return False
+        # Tokens are NFKC-normalized before the numeric checks, which turns
+        # e.g. "\u2474" into "(1)"; str.isdigit() also covers digits \d misses
+        return any(map(str.isdigit, unicodedata.normalize("NFKC", text)))
+
     def _should_end_table(self, line: str) -> bool:
         """Check if current line should end the table being built."""
         # Empty label row followed by non-table content
@@ -1152,12 +1590,23 @@ class _TableExtractor:
     # Label and Value Processing
     # -------------------------------------------------------------------------
     def _normalize_label(self, label: str) -> str:
-        normalized = unicodedata.normalize("NFKC", label)
-        normalized = self.DASH_RANGE_RE.sub("-", normalized)
-        normalized = self.WHITESPACE_RE.sub(" ", normalized).strip()
-        return self._split_compound_words(normalized, self.known_words)
+        cached = self._label_cache.get(label)
+        if cached is not None:
+            return cached
+        normalized = label
+        if not normalized.isascii():
+            # NFKC and the dash range are no-ops on ASCII labels
+            normalized = unicodedata.normalize("NFKC", normalized)
+            normalized = normalized.translate(self.DASH_RANGE_TRANS)
+        normalized = " ".join(normalized.split())
+        normalized = self._split_compound_words(normalized, self.known_words)
+        self._label_cache[label] = normalized
+        return normalized
 
     def _extract_date_header(self, line: str) -> Optional[tuple[str, list[str], str]]:
+        # Two dd/dd/dddd dates need four slashes; most lines have none
+        if line.count("/") < 4:
+            return None
         matches = list(self.DATE_HEADER_PATTERN.finditer(line))
         if len(matches) < 2:
             return None
@@ -1203,22 +1652,26 @@ class _TableExtractor:
             return values
         if len(values) == expected_count + 1 and cls._is_footnote_leader(values[0]):
             return values[1:]
-        merged = [cls._normalize_numeric_token(value) for value in values]
-        while len(merged) > expected_count:
-            merged_any = False
-            for idx in range(len(merged) - 1):
-                if merged[idx].isdigit() and merged[idx + 1].isdigit():
-                    merged[idx] = merged[idx] + merged[idx + 1]
-                    del merged[idx + 1]
-                    merged_any = True
-                    break
-            if not merged_any:
-                merged[0] = merged[0] + merged[1]
-                del merged[1]
+        normalized = [cls._normalize_numeric_token(value) for value in values]
+        excess = len(normalized) - expected_count
+        # Glue digit-only fragments back together, leftmost runs first
+        merged: list[str] = []
+        for value in normalized:
+            if excess > 0 and merged and merged[-1].isdigit() and value.isdigit():
+                merged[-1] += value
+                excess -= 1
+            else:
+                merged.append(value)
+        if excess > 0:
+            # Still too many: fold the surplus into the first value
+            merged[: excess + 1] = ["".join(merged[: excess + 1])]
         return merged
 
     @staticmethod
     def _normalize_numeric_token(token: str) -> str:
+        if token.isascii():
+            # NFKC leaves ASCII unchanged and "-" is its only dash-like char
+            return token
         normalized = unicodedata.normalize("NFKC", token)
         return "".join(
             "-" if _TableExtractor._is_dash_like(char) else char for char in normalized
@@ -1242,7 +1695,7 @@ class _TableExtractor:
         if position <= 0:
             return False
         prefix = normalized_line[:position]
-        return bool(re.search(r"\s{2,}$", prefix))
+        return bool(cls.TRAILING_DOUBLE_SPACE_RE.search(prefix))
 
     # -------------------------------------------------------------------------
     # Numeric Detection and Processing
@@ -1259,6 +1712,12 @@ class _TableExtractor:
             cleaned = cleaned[1:]
         if cleaned.endswith("%"):
             cleaned = cleaned[:-1]
+        if _TableExtractor.NUMERIC_TOKEN_RE.fullmatch(cleaned):
+            return True
+        if cleaned.isascii():
+            return False
+        # A few non-ASCII characters (e.g. Ethiopic digits) are str.isdigit()
+        # but not matched by \d
         return all(ch.isdigit() or ch in {",", "."} for ch in cleaned) and any(
             ch.isdigit() for ch in cleaned
         )
@@ -1269,11 +1728,11 @@ class _TableExtractor:
             return 0
         return sum(1 for token in text.split() if cls.is_numeric_token(token))
 
-    @staticmethod
-    def _split_numeric_blob(blob: str, expected_count: int) -> list[str]:
+    @classmethod
+    def _split_numeric_blob(cls, blob: str, expected_count: int) -> list[str]:
         if expected_count != 2:
             return [blob]
-        match = re.match(r"^(\d[\d,]*\.\d)(\d[\d,]*\.\d+)$", blob)
+        match = cls.NUMERIC_BLOB_RE.match(blob)
         if match:
             return [match.group(1), match.group(2)]
         return [blob]
@@ -1283,9 +1742,13 @@ class _TableExtractor:
     # -------------------------------------------------------------------------
     @staticmethod
     def _flush_current(tables: list[TableRows], current_rows: TableRows) -> None:
-        """Save completed table rows if they meet minimum requirements."""
+        """
+        Save completed table rows if they meet minimum requirements.
+
+        The list is stored as is; callers start a fresh list afterwards.
+        """
         if len(current_rows) >= 2:
-            tables.append(current_rows.copy())
+            tables.append(current_rows)
 
     def _extract_tables_from_text_simple(self) -> list[TableRows]:
         tables: list[TableRows] = []
@@ -1293,8 +1756,9 @@ class _TableExtractor:
         current_cols = 0
 
         def flush_current() -> None:
+            # Every flush is followed by rebinding current_rows to a new list
             if len(current_rows) >= 2:
-                tables.append(current_rows.copy())
+                tables.append(current_rows)
 
         for line in self.lines:
             if not line:
@@ -1329,14 +1793,11 @@ class _TableExtractor:
     # -------------------------------------------------------------------------
     # Word and Text Analysis
     # -------------------------------------------------------------------------
-    @staticmethod
-    def _collect_known_words(lines: list[str]) -> dict[str, int]:
-        words: dict[str, int] = {}
-        for line in lines:
-            for token in re.findall(r"[A-Za-z]+", line):
-                key = token.lower()
-                words[key] = words.get(key, 0) + 1
-        return words
+    @classmethod
+    def _collect_known_words(cls, lines: list[str]) -> dict[str, int]:
+        # Tokens are ASCII-only, so lowering each match (not the joined text,
+        # where e.g. the Kelvin sign would lower to "k") keeps counts exact
+        return Counter(map(str.lower, cls.ALPHA_TOKEN_RE.findall("\n".join(lines))))
 
     @staticmethod
     def _score_tables(tables: list[TableRows]) -> int:
@@ -1359,21 +1820,22 @@ class _TableExtractor:
         tokens = text.split()
         if not tokens:
             return text
-        line_words = {token.lower() for token in re.findall(r"[A-Za-z]+", text)}
-        candidates = set(known_words) | line_words
+        line_words = {token.lower() for token in cls.ALPHA_TOKEN_RE.findall(text)}
         new_tokens: list[str] = []
         for idx, token in enumerate(tokens):
             if "-" in token:
                 new_tokens.append(token)
                 continue
-            alpha = re.sub(r"[^A-Za-z]", "", token)
+            alpha = cls.NON_ALPHA_RE.sub("", token)
             if not alpha or alpha != alpha.lower() or len(alpha) < 6 or idx == 0:
                 new_tokens.append(token)
                 continue
             if known_words.get(alpha, 0) > 1:
                 new_tokens.append(token)
                 continue
-            split = cls._find_compound_split(alpha, candidates, allow_short=True)
+            split = cls._find_compound_split(
+                alpha, known_words, allow_short=True, extra_candidates=line_words
+            )
             if not split:
                 new_tokens.append(token)
                 continue
@@ -1384,7 +1846,10 @@ class _TableExtractor:
 
     @staticmethod
     def _find_compound_split(
-        token: str, candidates: set[str], allow_short: bool = False
+        token: str,
+        candidates: Container[str],
+        allow_short: bool = False,
+        extra_candidates: Container[str] = (),
     ) -> Optional[tuple[str, str]]:
         for idx in range(len(token) - 3, 1, -1):
             prefix = token[:idx]
@@ -1393,7 +1858,11 @@ class _TableExtractor:
                 continue
             if len(prefix) < 2:
                 continue
-            if prefix in candidates and suffix.isalpha() and len(suffix) >= 3:
+            if (
+                (prefix in candidates or prefix in extra_candidates)
+                and suffix.isalpha()
+                and len(suffix) >= 3
+            ):
                 return prefix, suffix
         return None
 
@@ -1532,7 +2001,7 @@ class _TableExtractor:
 
         row2 = [""] * column_count
         if unit_line:
-            parts = re.split(r"\s{2,}", unit_line.strip())
+            parts = self.DOUBLE_SPACE_RE.split(unit_line.strip())
             if parts:
                 row2[0] = self._normalize_label(parts[0])
             if len(parts) > 1:
@@ -1556,11 +2025,18 @@ class _TableExtractor:
         return 0 < len(line.split()) <= 6
 
     def _next_non_empty_line(self, start_index: int) -> str:
-        for idx in range(start_index + 1, len(self.lines)):
-            candidate = self.lines[idx]
-            if candidate:
-                return candidate
-        return ""
+        return self._next_non_empty[start_index]
+
+    @staticmethod
+    def _index_next_non_empty(lines: list[str]) -> list[str]:
+        """Map each line index to the first non-empty line after it."""
+        following = [""] * len(lines)
+        candidate = ""
+        for idx in range(len(lines) - 1, -1, -1):
+            following[idx] = candidate
+            if lines[idx]:
+                candidate = lines[idx]
+        return following
 
 
 def _extract_image(
@@ -1569,6 +2045,8 @@ def _extract_image(
     index: int,
     page_num: int,
     caption: str,
+    data_loaders: Optional[dict[Any, Callable[[], bytes]]] = None,
+    reader_lock: Optional[threading.Lock] = None,
 ) -> PdfImage:
     """
     Extract image data and properties from a PDF image XObject.
@@ -1581,9 +2059,15 @@ def _extract_image(
         image_obj: A pypdf image object from the XObject dictionary.
         name: The XObject name (e.g., "/Im0") for identification.
         index: 1-based index for ordering extracted images on the page.
+        data_loaders: Optional per-page cache of data loaders by XObject name,
+            so that an image drawn several times is decoded once.
+        reader_lock: Lock guarding the reader that owns image_obj; decoding
+            may read indirect objects through a reader shared with other
+            threads (see _open_document).
 
     Returns:
-        PdfImage with binary data and image properties.
+        PdfImage with image properties; the binary data is decoded on first
+        access of ``PdfImage.data``.
     """
 
     width = image_obj.get("/Width", 0)
@@ -1591,25 +2075,18 @@ def _extract_image(
     color_space = str(image_obj.get("/ColorSpace", "unknown"))
     bits = image_obj.get("/BitsPerComponent", 8)
 
-    # Determine image format based on compression filter
-    filter_type = image_obj.get("/Filter", "")
-    if isinstance(filter_type, list):
-        filter_type = filter_type[-1] if filter_type else ""
-    filter_type = str(filter_type)
-
-    img_format = FILTER_TO_FORMAT.get(filter_type, "raw")
-    content_type = FILTER_TO_CONTENT_TYPE.get(filter_type, "image/unknown")
-
-    # Get raw image data
-    try:
-        data = image_obj.get_data()
-    except Exception as e:
-        logger.warning("Failed to extract image data: %s", e)
-        data = image_obj._data if hasattr(image_obj, "_data") else b""
+    # Determine image format based on the compression filter chain
+    filters = image_obj.get("/Filter", "")
+    if isinstance(filters, list):
+        filter_chain = tuple(str(filter_name) for filter_name in filters)
+    else:
+        filter_chain = (str(filters),)
+    filter_type = filter_chain[-1] if filter_chain else ""
+    img_format, content_type = _image_type_for_filters(filter_chain)
 
     resolved_caption = caption or _extract_image_alt_text(image_obj)
 
-    return PdfImage(
+    image = PdfImage(
         index=index,
         name=str(name),
         caption=resolved_caption,
@@ -1618,11 +2095,58 @@ def _extract_image(
         color_space=color_space,
         bits_per_component=int(bits),
         filter=filter_type,
-        data=data,
         format=img_format,
         content_type=content_type,
         unit_name=page_num,
     )
+    loader = data_loaders.get(name) if data_loaders is not None else None
+    if loader is None:
+        loader = functools.cache(
+            functools.partial(_read_image_data, image_obj, filter_chain, reader_lock)
+        )
+        if data_loaders is not None:
+            data_loaders[name] = loader
+    image.set_data_loader(loader)
+    return image
+
+
+@functools.lru_cache(maxsize=64)
+def _image_type_for_filters(filter_chain: tuple[str, ...]) -> tuple[str, str]:
+    """
+    Map a /Filter chain to (format, content type).
+
+    The last filter determines the format. A chain in which an image codec
+    (e.g. /DCTDecode) is followed by further filters decodes to unusable
+    bytes, so it is reported as raw data (logged once per chain).
+    """
+    if not filter_chain:
+        return _UNKNOWN_IMAGE_TYPE
+    if not _TRANSPORT_FILTERS.issuperset(filter_chain[:-1]):
+        logger.debug("Unsupported image filter chain: %s", filter_chain)
+        return _UNKNOWN_IMAGE_TYPE
+    return _IMAGE_TYPE_BY_FILTER.get(filter_chain[-1], _UNKNOWN_IMAGE_TYPE)
+
+
+def _read_image_data(
+    image_obj: Any,
+    filter_chain: tuple[str, ...],
+    reader_lock: Optional[threading.Lock] = None,
+) -> bytes:
+    """Decode an image XObject stream (deferred until PdfImage.data is read)."""
+    raw = getattr(image_obj, "_data", None)
+    if raw is not None and filter_chain == _JPEG_ONLY_FILTER_CHAIN:
+        # pypdf passes DCT data through unchanged; the stored bytes are a JPEG
+        return raw
+    try:
+        # Indirect /Filter or /DecodeParms entries are resolved through the
+        # reader, which may be shared with threads extracting other pages
+        with reader_lock or contextlib.nullcontext():
+            return image_obj.get_data()
+    except Exception as e:
+        # Deliberately broad: this runs on PdfImage.data access, where pypdf
+        # decode errors (zlib, NotImplementedError, ...) must not escape
+        logger.warning("Failed to extract image data: %s", e)
+        return raw if raw is not None else b""
 
 
 # =============================================================================
@@ -1632,9 +2156,102 @@ def _extract_image(
 # This enables features like accessibility (alt text) and logical ordering.
 
 
+@dataclass
+class _McidState:
+    """Mutable state of the marked-content walk in _extract_page_mcid_data."""
+
+    # (MCID, pending ActualText) per open marked-content section. The bottom
+    # entry stands for "outside marked content" and is never popped, so the
+    # top can always be read without an emptiness check.
+    marked_content_stack: list[tuple[int | None, str | None]] = field(
+        default_factory=lambda: [(None, None)]
+    )
+    # Order of MCID occurrences
+    mcid_order: list[int] = field(default_factory=list)
+    # Position of each MCID in mcid_order
+    mcid_index: dict[int, int] = field(default_factory=dict)
+    # Text fragments per MCID, joined once the walk is done
+    mcid_text_parts: dict[int, list[str]] = field(default_factory=dict)
+    image_occurrences: list[dict[str, Any]] = field(default_factory=list)
+
+    def record_mcid(self, mcid: int) -> None:
+        """Append an MCID to the document order on its first occurrence."""
+        # Single probe: an existing entry always holds an earlier position
+        position = len(self.mcid_order)
+        if self.mcid_index.setdefault(mcid, position) == position:
+            self.mcid_order.append(mcid)
+
+
+def _handle_marked_content_begin(
+    state: _McidState, operator: bytes, operands: list[Any]
+) -> None:
+    """BDC/BMC: Begin Marked Content (with/without properties)."""
+    current_mcid = state.marked_content_stack[-1][0]
+    actual_text = None
+    if operator == _OP_BDC and len(operands) >= 2:
+        props = operands[1]
+        if isinstance(props, dict):
+            mcid = props.get("/MCID", _MISSING)
+            if mcid is not _MISSING:
+                current_mcid = mcid
+            actual_text = props.get("/ActualText")
+            if actual_text is not None:
+                actual_text = _as_text_object(actual_text)
+    state.marked_content_stack.append((current_mcid, actual_text))
+    if current_mcid is not None:
+        state.record_mcid(current_mcid)
+
+
+def _handle_marked_content_end(
+    state: _McidState, operator: bytes, operands: list[Any]
+) -> None:
+    """EMC: End Marked Content."""
+    stack = state.marked_content_stack
+    if len(stack) > 1:
+        stack.pop()
+
+
+def _handle_xobject(state: _McidState, operator: bytes, operands: list[Any]) -> None:
+    """Do: Invoke XObject (images)."""
+    if not operands:
+        return
+    current_mcid = state.marked_content_stack[-1][0]
+    state.image_occurrences.append({"name": operands[0], "mcid": current_mcid})
+
+
+def _handle_text_show(state: _McidState, operator: bytes, operands: list[Any]) -> None:
+    """Text operators: Tj, TJ, ', \"."""
+    stack = state.marked_content_stack
+    current_mcid, actual_text = stack[-1]
+    if current_mcid is None:
+        return
+    # Use ActualText if available (accessibility text)
+    if actual_text:
+        text = str(actual_text)
+        stack[-1] = (current_mcid, None)  # Only use once
+    else:
+        text = _extract_text_from_operands(operator, operands)
+    if text:
+        state.mcid_text_parts.setdefault(current_mcid, []).append(text)
+        state.record_mcid(current_mcid)
+
+
+# Operators relevant for the MCID walk; all others are skipped with one lookup
+_MCID_OPERATOR_HANDLERS: dict[bytes, Callable[[_McidState, bytes, list[Any]], None]] = {
+    _OP_BDC: _handle_marked_content_begin,
+    _OP_BMC: _handle_marked_content_begin,
+    _OP_EMC: _handle_marked_content_end,
+    _OP_DO: _handle_xobject,
+    _OP_TJ: _handle_text_show,
+    _OP_TJ_ARRAY: _handle_text_show,
+    _OP_NEXT_LINE_SHOW: _handle_text_show,
+    _OP_NEXT_LINE_SPACED_SHOW: _handle_text_show,
+}
+
+
 def _extract_page_mcid_data(
-    page: PageLike,
-) -> tuple[list[dict[str, Any]], list[int], dict[int, str]]:
+    stream: Optional[ContentStream],
+) -> tuple[list[dict[str, Any]], list[int], dict[int, int], dict[int, str]]:
     """
     Extract MCID (Marked Content Identifier) data from a PDF page.
 
@@ -1644,118 +2261,94 @@ def _extract_page_mcid_data(
         - Order in which MCIDs appear (for caption association)
 
     Args:
-        page: A pypdf PageObject to extract MCID data from.
+        stream: The parsed page content stream (None if it could not be read).
 
     Returns:
         Tuple of:
             - image_occurrences: List of dicts with 'name' and 'mcid' keys
             - mcid_order: List of MCIDs in document order
+            - mcid_index: Dict mapping MCID to its position in mcid_order
             - mcid_text: Dict mapping MCID to accumulated text content
     """
-    contents = page.get_contents()
-    if contents is None:
-        return [], [], {}
-
-    try:
-        stream = ContentStream(contents, page.pdf)
-    except Exception as e:
-        logger.debug("Failed to parse content stream: %s", e)
-        return [], [], {}
-
-    # State tracking for nested marked content
-    mcid_stack: list[int | None] = []  # Current MCID context
-    actual_text_stack: list[str | None] = []  # ActualText overrides
-    mcid_order: list[int] = []  # Order of MCID occurrences
-    mcid_text: dict[int, str] = {}  # Text content per MCID
-    image_occurrences: list[dict[str, Any]] = []
+    if stream is None:
+        return [], [], {}, {}
 
+    state = _McidState()
+    get_handler = _MCID_OPERATOR_HANDLERS.get
     for operands, operator in stream.operations:
-        op = (
-            operator.decode("utf-8", errors="ignore")
-            if isinstance(operator, bytes)
-            else operator
-        )
+        handler = get_handler(operator)
+        if handler is not None:
+            handler(state, operator, operands)
 
-        # BDC/BMC: Begin Marked Content (with/without properties)
-        if op in ("BDC", "BMC"):
-            current_mcid = mcid_stack[-1] if mcid_stack else None
-            actual_text = None
-            if op == "BDC" and len(operands) >= 2:
-                props = operands[1]
-                if isinstance(props, dict):
-                    if "/MCID" in props:
-                        current_mcid = props.get("/MCID")
-                    actual_text = props.get("/ActualText")
-            mcid_stack.append(current_mcid)
-            actual_text_stack.append(actual_text)
-            if current_mcid is not None and current_mcid not in mcid_order:
-                mcid_order.append(current_mcid)
-            continue
+    mcid_text = {mcid: "".join(parts) for mcid, parts in state.mcid_text_parts.items()}
+    return state.image_occurrences, state.mcid_order, state.mcid_index, mcid_text
 
-        # EMC: End Marked Content
-        if op == "EMC":
-            if mcid_stack:
-                mcid_stack.pop()
-            if actual_text_stack:
-                actual_text_stack.pop()
-            continue
 
-        # Do: Invoke XObject (images)
-        if op == "Do":
-            if not operands:
-                continue
-            current_mcid = mcid_stack[-1] if mcid_stack else None
-            image_occurrences.append({"name": operands[0], "mcid": current_mcid})
-            continue
-
-        # Text operators: Tj, TJ, ', "
-        if op in ("Tj", "TJ", "'", '"'):
-            current_mcid = mcid_stack[-1] if mcid_stack else None
-            if current_mcid is None:
-                continue
-            # Use ActualText if available (accessibility text)
-            actual_text = actual_text_stack[-1] if actual_text_stack else None
-            if actual_text:
-                text = str(actual_text)
-                actual_text_stack[-1] = None  # Only use once
-            else:
-                text = _extract_text_from_operands(op, operands)
-            if text:
-                mcid_text[current_mcid] = mcid_text.get(current_mcid, "") + text
-                if current_mcid not in mcid_order:
-                    mcid_order.append(current_mcid)
-
-    return image_occurrences, mcid_order, mcid_text
-
-
-def _extract_text_from_operands(operator: str, operands: list[Any]) -> str:
+def _extract_text_from_operands(operator: bytes, operands: list[Any]) -> str:
     """Extract text string from PDF text operator operands."""
     if not operands:
         return ""
-    if operator == "TJ":
-        # TJ operator: array of strings and positioning values
-        parts = []
-        for item in operands[0]:
-            if isinstance(item, (str, bytes)):
-                parts.append(_normalize_text(item))
-        return "".join(parts)
-    if isinstance(operands[0], (str, bytes)):
-        return _normalize_text(operands[0])
+    if operator == _OP_TJ_ARRAY:
+        # TJ operator: array of strings and positioning values. Items are
+        # pypdf subclasses of bytes/str/int/float, hence isinstance; a list
+        # comprehension joins faster than a generator. ByteStringObject is a
+        # bytes subclass and is decoded without copying.
+        return "".join(
+            [
+                _decode_pdf_string(item) if isinstance(item, bytes) else str(item)
+                for item in operands[0]
+                if isinstance(item, (str, bytes))
+            ]
+        )
+    text = operands[0]
+    if isinstance(text, bytes):
+        return _decode_pdf_string(text)
+    if isinstance(text, str):
+        return str(text)
     return ""
 
 
-def _normalize_text(value: Any) -> str:
-    """Convert PDF text value to Python string."""
-    if value is None:
-        return ""
+def _as_text_object(value: Any) -> Any:
+    """
+    Decode a raw string operand the way pypdf's default parsing would.
+
+    The shared content stream keeps strings as bytes; this restores the
+    UTF-16/PDFDocEncoding detection (falling back to the raw bytes).
+    """
     if isinstance(value, bytes):
-        return value.decode("utf-8", errors="ignore")
-    return str(value)
+        return create_string_object(bytes(value))
+    return value
+
+
+def _decode_pdf_string(raw: bytes) -> str:
+    """
+    Decode a raw PDF string operand to text.
+
+    Same result as ``create_string_object`` with a UTF-8 fallback for strings
+    pypdf keeps as bytes, but without building intermediate pypdf string
+    objects and with PDFDocEncoding applied via ``str.translate`` instead of a
+    per-character loop. This runs for every shown string on a page, so errors
+    are passed positionally (keyword arguments are parsed on every call; a
+    cached ``codecs.getdecoder`` is slower than ``bytes.decode``).
+    """
+    try:
+        if raw.startswith(_UTF16_BOMS):
+            return raw.decode("utf-16")
+        if raw.startswith(b"\x00"):
+            return raw.decode("utf-16be")
+        if raw[1:2] == b"\x00":
+            return raw.decode("utf-16le")
+    except UnicodeDecodeError:
+        return raw.decode("utf-8", "ignore")
+    if len(raw.translate(None, _PDFDOC_UNDEFINED_BYTES)) != len(raw):
+        return raw.decode("utf-8", "ignore")
+    return raw.decode("latin-1").translate(_PDFDOC_FROM_LATIN1)
 
 
 def _lookup_caption(
     mcid: int | None,
     mcid_order: list[int],
+    mcid_index: dict[int, int],
     mcid_text: dict[int, str],
 ) -> str:
     """
@@ -1770,15 +2363,13 @@ def _lookup_caption(
     text = mcid_text.get(mcid, "").strip()
     if text:
         return text
-    if not mcid_order:
-        return ""
     # Look for text in subsequent MCIDs (caption after image)
-    try:
-        start_index = mcid_order.index(mcid)
-    except ValueError:
+    start_index = mcid_index.get(mcid)
+    if start_index is None:
         return ""
-    for next_mcid in mcid_order[start_index + 1 :]:
-        next_text = mcid_text.get(next_mcid, "").strip()
+    # Index instead of slicing, so each image does not copy the order's tail
+    for position in range(start_index + 1, len(mcid_order)):
+        next_text = mcid_text.get(mcid_order[position], "").strip()
         if next_text:
             return next_text
     return ""
@@ -1794,8 +2385,10 @@ def _extract_image_alt_text(image_obj: Any) -> str:
         - /Caption: Caption text
         - /TU: Tool tip (user-facing description)
     """
-    caption_keys = ("/Alt", "/Title", "/Caption", "/TU")
-    for key in caption_keys:
+    # Most images (e.g. from scanners) carry none of these keys
+    if image_obj.keys().isdisjoint(_IMAGE_CAPTION_KEY_SET):
+        return ""
+    for key in _IMAGE_CAPTION_KEYS:
         value = image_obj.get(key)
         if isinstance(value, str):
             if value.strip():
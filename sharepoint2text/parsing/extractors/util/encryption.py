@@ -38,13 +38,18 @@ def is_odf_encrypted(file_like: io.BytesIO) -> bool:
         except KeyError:
             return False
 
-    encrypted = (
+    encrypted = is_odf_manifest_encrypted(manifest)
+    file_like.seek(0)
+    return encrypted
+
+
+def is_odf_manifest_encrypted(manifest: str) -> bool:
+    """Check decoded META-INF/manifest.xml content for encryption markers."""
+    return (
         "encryption-data" in manifest
         or "manifest:encrypted" in manifest
         or "manifest:algorithm" in manifest
     )
-    file_like.seek(0)
-    return encrypted
 
 
 def is_xls_encrypted(file_like: io.BytesIO) -> bool:
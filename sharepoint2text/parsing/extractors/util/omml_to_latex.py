@@ -261,7 +261,7 @@ def omml_to_latex(omath_element: ET.Element | None) -> str:
         if elem is None:
             return ""
 
-        tag = elem.tag.split("}")[-1]
+        tag = elem.tag.rpartition("}")[2]
 
         # Skip property elements
         if tag in _SKIP_TAGS:
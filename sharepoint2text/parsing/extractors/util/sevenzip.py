@@ -21,13 +21,13 @@ Not supported:
 - Some advanced compression methods
 """
 
-import io
 import lzma
 import os
 import struct
 import zlib
 from dataclasses import dataclass
-from typing import BinaryIO, Dict, List, Optional, Tuple
+from itertools import chain
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 __all__ = [
     "Bad7zFile",
@@ -67,6 +67,14 @@ CODER_LZMA2 = b"\x21"
 CODER_BCJ = b"\x03\x03\x01\x03"
 CODER_AES_PREFIX = b"\x06\xf1\x07"
 
+# Upper bound for packed reads and decompressed chunks while extracting
+_CHUNK_SIZE = 1 << 20
+
+# Bits of every byte value, most significant first (7z bit vector order)
+_BYTE_BITS: Tuple[Tuple[bool, ...], ...] = tuple(
+    tuple(bool(value & (0x80 >> bit)) for bit in range(8)) for value in range(256)
+)
+
 
 class Bad7zFile(Exception):
     """Exception raised for invalid or unsupported 7z files."""
@@ -140,7 +148,9 @@ class SevenZipReader:
             raise Bad7zFile("File object must support read() method")
 
         self._archive_file = file
-        self._stream: BinaryIO = file
+        # Header being parsed and the read position within it
+        self._header = b""
+        self._pos = 0
         self._files: List[FileInfo] = []
         self._folders: List[Folder] = []
         self._pack_positions: List[int] = []
@@ -156,7 +166,7 @@ class SevenZipReader:
     # -------------------------------------------------------------------------
 
     def _read_bytes(self, n: int) -> bytes:
-        """Read exactly n bytes, raising Bad7zFile on EOF.
+        """Read exactly n header bytes, raising Bad7zFile on EOF.
 
         Args:
             n: Number of bytes to read
@@ -167,16 +177,22 @@ class SevenZipReader:
         Raises:
             Bad7zFile: If EOF is encountered before reading n bytes
         """
-        data = self._stream.read(n)
+        pos = self._pos
+        data = self._header[pos : pos + n]
         if len(data) != n:
             raise Bad7zFile(
                 f"Unexpected end of file (expected {n} bytes, got {len(data)})"
             )
+        self._pos = pos + n
         return data
 
     def _read_uint8(self) -> int:
         """Read an unsigned 8-bit integer in little-endian format."""
-        return struct.unpack("<B", self._read_bytes(1))[0]
+        pos = self._pos
+        if pos >= len(self._header):
+            raise Bad7zFile("Unexpected end of file (expected 1 bytes, got 0)")
+        self._pos = pos + 1
+        return self._header[pos]
 
     def _read_uint32(self) -> int:
         """Read an unsigned 32-bit integer in little-endian format."""
@@ -196,16 +212,15 @@ class SevenZipReader:
             int: The decoded number
         """
         first_byte = self._read_uint8()
-        mask = 0x80
-        value = 0
-
-        for i in range(8):
-            if (first_byte & mask) == 0:
-                value |= (first_byte & (mask - 1)) << (i * 8)
-                return value
-            value |= self._read_uint8() << (i * 8)
-            mask >>= 1
-
+        # The leading one bits of the first byte count the extra bytes
+        extra = 8 - (~first_byte & 0xFF).bit_length()
+        if extra == 0:
+            return first_byte
+
+        value = int.from_bytes(self._read_bytes(extra), "little")
+        if extra < 8:
+            # Remaining low bits of the first byte are the most significant
+            value |= (first_byte & (0x7F >> extra)) << (8 * extra)
         return value
 
     def _read_boolean_vector(
@@ -227,22 +242,15 @@ class SevenZipReader:
             if all_defined != 0:
                 return [True] * count
 
-        result = []
-        byte_value = 0
-        mask = 0
-
-        for _ in range(count):
-            if mask == 0:
-                byte_value = self._read_uint8()
-                mask = 0x80
-            result.append((byte_value & mask) != 0)
-            mask >>= 1
-
+        # One read for the whole vector, expanded a byte at a time via table
+        data = self._read_bytes((count + 7) // 8)
+        result = list(chain.from_iterable(map(_BYTE_BITS.__getitem__, data)))
+        del result[count:]
         return result
 
     def _seek_back_one(self) -> None:
-        """Move file position back by one byte."""
-        self._stream.seek(self._stream.tell() - 1)
+        """Move the header read position back by one byte."""
+        self._pos -= 1
 
     # -------------------------------------------------------------------------
     # Header parsing
@@ -257,35 +265,43 @@ class SevenZipReader:
         Raises:
             Bad7zFile: If the archive format is invalid or unsupported
         """
-        self._stream = self._archive_file
-        self._stream.seek(0)
+        self._archive_file.seek(0)
+
+        # Signature header: magic (6), version (2), start header CRC (4) and
+        # the 20-byte start header, read once and checked in place
+        signature = self._archive_file.read(32)
 
         # Verify magic signature (6 bytes)
-        if self._read_bytes(6) != MAGIC:
+        if signature[:6] != MAGIC:
             raise Bad7zFile("Invalid 7z signature")
+        if len(signature) != 32:
+            raise Bad7zFile(
+                f"Unexpected end of file (expected 32 bytes, got {len(signature)})"
+            )
 
         # Verify version (must be 0.x where x <= 4)
-        major, minor = self._read_uint8(), self._read_uint8()
+        major, minor = signature[6], signature[7]
         if major != 0 or minor > 4:
             raise Bad7zFile(f"Unsupported 7z version: {major}.{minor}")
 
         # Read start header fields (20 bytes total)
-        start_header_crc = self._read_uint32()
-        next_header_offset = self._read_uint64()
-        next_header_size = self._read_uint64()
-        next_header_crc = self._read_uint32()
+        (
+            start_header_crc,
+            next_header_offset,
+            next_header_size,
+            next_header_crc,
+        ) = struct.unpack_from("<IQQI", signature, 8)
 
         # Verify start header CRC (covers 20 bytes after the CRC field)
-        self._stream.seek(12)
-        if zlib.crc32(self._stream.read(20)) & 0xFFFFFFFF != start_header_crc:
+        if zlib.crc32(memoryview(signature)[12:]) & 0xFFFFFFFF != start_header_crc:
             raise Bad7zFile("Start header CRC mismatch")
 
         # Read and verify end header
         self._header_offset = 32
         header_pos = self._header_offset + next_header_offset
 
-        self._stream.seek(header_pos)
-        header_data = self._stream.read(next_header_size)
+        self._archive_file.seek(header_pos)
+        header_data = self._archive_file.read(next_header_size)
 
         if len(header_data) != next_header_size:
             raise Bad7zFile("Could not read full header")
@@ -294,7 +310,8 @@ class SevenZipReader:
             raise Bad7zFile("Header CRC mismatch")
 
         # Parse the header content
-        self._stream = io.BytesIO(header_data)
+        self._header = header_data
+        self._pos = 0
         self._parse_end_header()
 
     def _parse_end_header(self) -> None:
@@ -335,7 +352,8 @@ class SevenZipReader:
             pack_sizes,
             source_file=self._archive_file,
         )
-        self._stream = io.BytesIO(decompressed)
+        self._header = decompressed
+        self._pos = 0
 
     def _parse_main_header(self) -> None:
         """Parse the main header containing streams and files info."""
@@ -591,7 +609,7 @@ class SevenZipReader:
                 break
 
             size = self._read_number()
-            end_pos = self._stream.tell() + size
+            end_pos = self._pos + size
 
             if prop_id == PROP_EMPTY_STREAM:
                 empty_streams = self._read_boolean_vector(num_files)
@@ -603,14 +621,7 @@ class SevenZipReader:
             elif prop_id == PROP_NAME:
                 if self._read_uint8() != 0:
                     raise Bad7zFile("External names not supported")
-                for i in range(num_files):
-                    name_chars = []
-                    while True:
-                        char = struct.unpack("<H", self._read_bytes(2))[0]
-                        if char == 0:
-                            break
-                        name_chars.append(chr(char))
-                    names[i] = "".join(name_chars)
+                names = self._read_names(num_files, end_pos - self._pos)
 
             elif prop_id == PROP_WIN_ATTRIBUTES:
                 defined = self._read_boolean_vector(num_files, check_defined=True)
@@ -619,10 +630,33 @@ class SevenZipReader:
                         attributes[i] = self._read_uint32()
 
             # Ensure correct position for next property
-            self._stream.seek(end_pos)
+            self._pos = end_pos
 
         self._build_file_list(num_files, empty_streams, names, attributes)
 
+    def _read_names(self, num_files: int, size: int) -> List[str]:
+        """Read NUL-terminated UTF-16LE file names.
+
+        Args:
+            num_files: Number of names to read
+            size: Number of bytes left in the names property
+
+        Returns:
+            List[str]: One name per file
+
+        Raises:
+            Bad7zFile: If the property holds fewer than num_files names
+        """
+        data = self._read_bytes(size)
+        # Decoded in one go so surrogate pairs combine; lone surrogates are
+        # kept as they are
+        text = data[: size & ~1].decode("utf-16-le", errors="surrogatepass")
+        names = text.split("\x00", num_files)
+        if len(names) <= num_files:
+            raise Bad7zFile("Truncated file names")
+        del names[num_files:]
+        return names
+
     def _build_file_list(
         self,
         num_files: int,
@@ -691,6 +725,34 @@ class SevenZipReader:
         Returns:
             bytes: The decompressed folder data
 
+        Raises:
+            Bad7zFile: If no coders are defined or decompression fails
+        """
+        return b"".join(
+            self._iter_folder_data(folder, pack_pos, pack_sizes, source_file)
+        )
+
+    def _iter_folder_data(
+        self,
+        folder: Folder,
+        pack_pos: int,
+        pack_sizes: List[int],
+        source_file: Optional[BinaryIO] = None,
+    ) -> Iterator[bytes]:
+        """Yield the decompressed data of a folder in chunks.
+
+        Packed data is read and decoded incrementally, so neither the packed
+        nor the decompressed folder is held in memory as a whole.
+
+        Args:
+            folder: The compression folder containing file data
+            pack_pos: Position in the archive where compressed data starts
+            pack_sizes: Sizes of compressed data blocks
+            source_file: Optional file to read from (defaults to self.file)
+
+        Yields:
+            bytes: Consecutive chunks of at most _CHUNK_SIZE bytes
+
         Raises:
             Bad7zFile: If no coders are defined or decompression fails
         """
@@ -705,23 +767,22 @@ class SevenZipReader:
             file_to_read.seek(0, 2)
             total_size = file_to_read.tell() - pack_pos
 
-        file_to_read.seek(pack_pos)
-        data = file_to_read.read(total_size)
+        data = _iter_packed_data(file_to_read, pack_pos, total_size)
 
         # Apply decoders in reverse order (last decoder applied first)
         for coder_id, properties in reversed(folder.coders):
             data = self._apply_decoder(coder_id, properties, data, folder.unpack_sizes)
 
-        return data
+        yield from data
 
     def _apply_decoder(
         self,
         coder_id: bytes,
         properties: Optional[bytes],
-        data: bytes,
+        data: Iterator[bytes],
         unpack_sizes: List[int],
-    ) -> bytes:
-        """Apply a single decoder to data."""
+    ) -> Iterator[bytes]:
+        """Apply a single decoder to a stream of data chunks."""
         if coder_id == CODER_COPY:
             return data
 
@@ -740,17 +801,20 @@ class SevenZipReader:
         raise Bad7zFile(f"Unsupported compression method: {coder_id.hex()}")
 
     def _decompress_lzma(
-        self, data: bytes, properties: Optional[bytes], unpack_sizes: List[int]
-    ) -> bytes:
+        self,
+        data: Iterator[bytes],
+        properties: Optional[bytes],
+        unpack_sizes: List[int],
+    ) -> Iterator[bytes]:
         """Decompress LZMA data.
 
         Args:
-            data: Compressed LZMA data
+            data: Compressed LZMA data chunks
             properties: LZMA properties (first 5 bytes should be present)
             unpack_sizes: Expected uncompressed sizes
 
         Returns:
-            bytes: Decompressed data
+            Iterator[bytes]: Decompressed data chunks
 
         Raises:
             Bad7zFile: If properties are invalid or decompression fails
@@ -762,24 +826,23 @@ class SevenZipReader:
         size_bytes = struct.pack("<Q", unpack_size) if unpack_size >= 0 else b"\xff" * 8
 
         # Construct LZMA alone format: props (5 bytes) + size (8 bytes) + data
-        lzma_stream = properties[:5] + size_bytes + data
+        lzma_stream = chain([properties[:5] + size_bytes], data)
 
-        try:
-            return lzma.LZMADecompressor(format=lzma.FORMAT_ALONE).decompress(
-                lzma_stream
-            )
-        except lzma.LZMAError as e:
-            raise Bad7zFile(f"LZMA decompression failed: {e}") from e
+        return _iter_decompressed(
+            lzma.LZMADecompressor(format=lzma.FORMAT_ALONE), lzma_stream, "LZMA"
+        )
 
-    def _decompress_lzma2(self, data: bytes, properties: Optional[bytes]) -> bytes:
+    def _decompress_lzma2(
+        self, data: Iterator[bytes], properties: Optional[bytes]
+    ) -> Iterator[bytes]:
         """Decompress LZMA2 data.
 
         Args:
-            data: Compressed LZMA2 data
+            data: Compressed LZMA2 data chunks
             properties: LZMA2 properties (at least 1 byte required)
 
         Returns:
-            bytes: Decompressed data
+            Iterator[bytes]: Decompressed data chunks
 
         Raises:
             Bad7zFile: If properties are invalid or decompression fails
@@ -800,11 +863,12 @@ class SevenZipReader:
             filters = [{"id": lzma.FILTER_LZMA2, "preset": 6}]
 
         try:
-            return lzma.LZMADecompressor(
+            decompressor = lzma.LZMADecompressor(
                 format=lzma.FORMAT_RAW, filters=filters
-            ).decompress(data)
+            )
         except lzma.LZMAError as e:
             raise Bad7zFile(f"LZMA2 decompression failed: {e}") from e
+        return _iter_decompressed(decompressor, data, "LZMA2")
 
     # -------------------------------------------------------------------------
     # Public API
@@ -847,23 +911,26 @@ class SevenZipReader:
             if folder_idx not in self._folder_to_files:
                 continue
 
-            try:
-                decompressed = self._decompress_folder(
+            chunks = _with_error_context(
+                self._iter_folder_data(
                     folder,
                     pack_pos,
                     self._pack_sizes,
                     source_file=source_file,
-                )
-            except Bad7zFile as e:
-                raise Bad7zFile(f"Failed to decompress folder {folder_idx}: {e}") from e
-
-            self._extract_files_from_folder(path, folder_idx, decompressed)
+                ),
+                f"Failed to decompress folder {folder_idx}",
+            )
+            self._extract_files_from_folder(path, folder_idx, chunks)
 
     def _extract_files_from_folder(
-        self, base_path: str, folder_idx: int, decompressed: bytes
+        self, base_path: str, folder_idx: int, chunks: Iterator[bytes]
     ) -> None:
-        """Extract individual files from decompressed folder data."""
-        offset = 0
+        """Extract individual files from a folder's decompressed data chunks.
+
+        Each file is written as its data is decompressed, so at most one
+        chunk of the folder is held in memory.
+        """
+        pending = memoryview(b"")
 
         for file_idx in self._folder_to_files[folder_idx]:
             file_info = self._files[file_idx]
@@ -878,22 +945,25 @@ class SevenZipReader:
                     f"Invalid file size for '{file_info.filename}': {file_info.uncompressed}"
                 )
 
-            if offset + file_info.uncompressed > len(decompressed):
-                raise Bad7zFile(
-                    f"File '{file_info.filename}' exceeds decompressed data bounds"
-                )
-
             file_path = _safe_join(base_path, file_info.filename)
             parent_dir = os.path.dirname(file_path)
             if parent_dir:
                 _mkdirs(parent_dir)
 
-            file_data = decompressed[offset : offset + file_info.uncompressed]
-            offset += file_info.uncompressed
-
+            remaining = file_info.uncompressed
             try:
                 with open(file_path, "wb") as f:
-                    f.write(file_data)
+                    while remaining:
+                        if not pending:
+                            pending = memoryview(next(chunks, b""))
+                            if not pending:
+                                raise Bad7zFile(
+                                    f"File '{file_info.filename}' exceeds decompressed data bounds"
+                                )
+                        part = pending[:remaining]
+                        f.write(part)
+                        remaining -= len(part)
+                        pending = pending[len(part) :]
             except OSError as e:
                 raise Bad7zFile(f"Failed to write file '{file_path}': {e}") from e
 
@@ -910,6 +980,48 @@ class SevenZipReader:
         )
 
 
+def _iter_packed_data(file: BinaryIO, pos: int, size: int) -> Iterator[bytes]:
+    """Yield up to size bytes from pos in chunks of at most _CHUNK_SIZE."""
+    file.seek(pos)
+    remaining = size
+    while remaining > 0:
+        chunk = file.read(min(remaining, _CHUNK_SIZE))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _iter_decompressed(
+    decompressor: "lzma.LZMADecompressor", data: Iterable[bytes], method: str
+) -> Iterator[bytes]:
+    """Feed data chunks to decompressor, yielding at most _CHUNK_SIZE at a time.
+
+    Input after the end of the compressed stream is ignored.
+    """
+    try:
+        for chunk in data:
+            if decompressor.eof:
+                return
+            output = decompressor.decompress(chunk, _CHUNK_SIZE)
+            while True:
+                if output:
+                    yield output
+                if decompressor.eof or decompressor.needs_input:
+                    break
+                output = decompressor.decompress(b"", _CHUNK_SIZE)
+    except lzma.LZMAError as e:
+        raise Bad7zFile(f"{method} decompression failed: {e}") from e
+
+
+def _with_error_context(chunks: Iterator[bytes], context: str) -> Iterator[bytes]:
+    """Prefix Bad7zFile errors raised while iterating chunks with context."""
+    try:
+        yield from chunks
+    except Bad7zFile as e:
+        raise Bad7zFile(f"{context}: {e}") from e
+
+
 def _mkdirs(path: str) -> None:
     try:
         os.makedirs(path, exist_ok=True)
@@ -1,12 +1,26 @@
+import functools
 import io
+import struct
+import zipfile
+import zlib
+from typing import Callable, Iterator, Sequence
 from xml.etree.ElementTree import Element as XmlElement
 
+from sharepoint2text.parsing.extractors.util.encryption import (
+    is_odf_manifest_encrypted,
+)
 from sharepoint2text.parsing.extractors.util.zip_bomb import open_zipfile
 from sharepoint2text.parsing.extractors.util.zip_utils import (
+    iterparse_zip_xml,
     read_zip_text,
     read_zip_xml_root,
 )
 
+_ODF_MANIFEST_PATH = "META-INF/manifest.xml"
+# Local file header: signature, 22 fixed bytes, file name and extra lengths
+_LOCAL_FILE_HEADER = struct.Struct("<4s22xHH")
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+
 
 class ZipContext:
     """Reusable ZIP context with convenience helpers for reading OOXML/ODF files."""
@@ -27,6 +41,11 @@ class ZipContext:
     def read_xml_root(self, path: str) -> XmlElement:
         return read_zip_xml_root(self._zip, path)
 
+    def iterparse_xml(
+        self, path: str, events: Sequence[str] = ("end",)
+    ) -> Iterator[tuple[str, XmlElement]]:
+        return iterparse_zip_xml(self._zip, path, events)
+
     def read_text(self, path: str) -> str:
         return read_zip_text(self._zip, path)
 
@@ -36,5 +55,59 @@ class ZipContext:
     def open_stream(self, path: str) -> io.BufferedReader:
         return self._zip.open(path)
 
+    def file_size(self, path: str) -> int:
+        return self._zip.getinfo(path).file_size
+
+    def member_loader(self, path: str) -> Callable[[], bytes]:
+        """
+        Return a callable that decompresses ``path`` on demand.
+
+        Only the member's compressed bytes are copied out of the archive, so
+        a loader keeps neither the archive nor the caller's stream alive and
+        can be called from any thread. Members that are encrypted or use a
+        method other than stored/deflated are read eagerly instead.
+        """
+        info = self._zip.getinfo(path)
+        if info.flag_bits & 0x1 or info.compress_type not in (
+            zipfile.ZIP_STORED,
+            zipfile.ZIP_DEFLATED,
+        ):
+            data = self._zip.read(path)
+            return lambda: data
+        return functools.partial(
+            _inflate_member, info, self._read_compressed_member(info)
+        )
+
+    def _read_compressed_member(self, info: zipfile.ZipInfo) -> bytes:
+        self.file_like.seek(info.header_offset)
+        signature, name_length, extra_length = _LOCAL_FILE_HEADER.unpack(
+            self.file_like.read(_LOCAL_FILE_HEADER.size)
+        )
+        if signature != _LOCAL_FILE_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(
+                f"Bad magic number for file header of {info.filename!r}"
+            )
+        self.file_like.seek(name_length + extra_length, io.SEEK_CUR)
+        return self.file_like.read(info.compress_size)
+
+    def is_odf_encrypted(self) -> bool:
+        """Check META-INF/manifest.xml of the open ODF archive for encryption."""
+        if not self.exists(_ODF_MANIFEST_PATH):
+            return False
+        return is_odf_manifest_encrypted(self.read_text(_ODF_MANIFEST_PATH))
+
     def close(self) -> None:
         self._zip.close()
+
+
+def _inflate_member(info: zipfile.ZipInfo, compressed: bytes) -> bytes:
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        # Bounded like ZipFile.read: never inflate past the declared size
+        data = zlib.decompressobj(-zlib.MAX_WBITS).decompress(
+            compressed, info.file_size
+        )
+    else:
+        data = compressed
+    if len(data) != info.file_size or zlib.crc32(data) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    return data
@@ -1,11 +1,22 @@
+import io
+import re
 import zipfile
-from typing import Dict, List
+from typing import IO, Dict, Iterator, List, Optional, Sequence
+from xml.etree import ElementTree as FastET
 from xml.etree.ElementTree import Element as XmlElement
 
 from defusedxml import ElementTree as ET
 
 RELATIONSHIP_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+_XML_DECLARATION_ENCODING_RE = re.compile(
+    rb"<\?xml[^>]*?\sencoding\s*=\s*[\"']([A-Za-z0-9._-]+)[\"']"
+)
+_ASCII_COMPATIBLE_ENCODINGS = frozenset({"utf-8", "utf8", "us-ascii", "ascii"})
+_PROLOG_READ_SIZE = 4096
+_PROLOG_SCAN_LIMIT = 64 * 1024
+
 
 def read_zip_text(zf: zipfile.ZipFile, path: str) -> str:
     """Read a text file from a ZIP archive using UTF-8 decoding."""
@@ -14,7 +25,117 @@ def read_zip_text(zf: zipfile.ZipFile, path: str) -> str:
 
 def read_zip_xml_root(zf: zipfile.ZipFile, path: str) -> XmlElement:
     """Parse an XML file from a ZIP archive and return its root element."""
-    return ET.fromstring(zf.read(path))
+    return parse_xml_bytes(zf.read(path))
+
+
+def parse_xml_bytes(data: bytes) -> XmlElement:
+    """
+    Parse untrusted XML and return its root element.
+
+    defusedxml drives expat through the pure-Python XMLParser, which costs a
+    Python callback per element. Entity expansion and external entity attacks
+    both need a DTD, so documents that provably have none (the norm for
+    OOXML/ODF parts) are parsed with the C-accelerated parser instead. All
+    other documents go through defusedxml, which rejects entity declarations.
+    """
+    if _is_dtd_free(data):
+        return FastET.fromstring(data)
+    return ET.fromstring(data)
+
+
+def iterparse_zip_xml(
+    zf: zipfile.ZipFile, path: str, events: Sequence[str]
+) -> Iterator[tuple[str, XmlElement]]:
+    """
+    Incrementally parse an XML file from a ZIP archive.
+
+    Yields (event, element) pairs like ElementTree.iterparse, with the same
+    parser choice as parse_xml_bytes. A DOCTYPE may only appear in the
+    prolog, so only the bytes up to the root element are inspected; when
+    they are DTD-free the member is decompressed and parsed in chunks, and
+    callers can clear() elements they have consumed so that neither the
+    document bytes nor the full tree are ever held in memory. Members that
+    need defusedxml are read as a whole.
+    """
+    with zf.open(path) as stream:
+        prolog = b""
+        verdict = None
+        while verdict is None and len(prolog) < _PROLOG_SCAN_LIMIT:
+            chunk = stream.read(_PROLOG_READ_SIZE)
+            if not chunk:
+                break
+            prolog += chunk
+            verdict = _scan_prolog(prolog)
+        if verdict:
+            yield from FastET.iterparse(_PrologReplay(prolog, stream), events=events)
+            return
+        data = prolog + stream.read()
+    yield from ET.iterparse(io.BytesIO(data), events=events)
+
+
+class _PrologReplay:
+    """Readable that returns the already-consumed prolog before the stream."""
+
+    def __init__(self, prolog: bytes, stream: IO[bytes]) -> None:
+        self._prolog = prolog
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if self._prolog:
+            data, self._prolog = self._prolog, b""
+            return data
+        return self._stream.read(size)
+
+
+def _is_dtd_free(data: bytes) -> bool:
+    """Check that a complete document has no DOCTYPE, judged on its raw bytes."""
+    return _scan_prolog(data) is True
+
+
+def _scan_prolog(data: bytes) -> Optional[bool]:
+    """
+    Scan the prolog of a document for a DOCTYPE.
+
+    Returns True once the root element starts without a DOCTYPE before it,
+    False if there is one (or the prolog cannot be judged safely), and None
+    if data ends before the root element. Only valid for ASCII-compatible
+    encodings, where a declaration would appear as literal ASCII; anything
+    else (UTF-16, EBCDIC, ...) returns False so that defusedxml handles it.
+    """
+    body = data[len(_UTF8_BOM) :] if data.startswith(_UTF8_BOM) else data
+    if len(body) < 4:
+        return None
+    # "<" followed by NUL bytes is how expat detects BOM-less UTF-16/32
+    if not body.startswith(b"<") or b"\x00" in body[:4]:
+        return False
+    if body.startswith(b"<?xml"):
+        end = body.find(b"?>")
+        if end < 0:
+            return None
+        match = _XML_DECLARATION_ENCODING_RE.match(body[: end + 2])
+        if match:
+            encoding = match.group(1).decode("ascii").lower()
+            if encoding not in _ASCII_COMPATIBLE_ENCODINGS:
+                return False
+    pos = 0
+    while True:
+        pos = body.find(b"<", pos)
+        if pos < 0 or len(body) < pos + 4:
+            return None
+        if body.startswith(b"<?", pos):
+            end = body.find(b"?>", pos + 2)
+            if end < 0:
+                return None
+            pos = end + 2
+        elif body.startswith(b"<!--", pos):
+            end = body.find(b"-->", pos + 4)
+            if end < 0:
+                return None
+            pos = end + 3
+        elif body.startswith(b"<!", pos):
+            return False
+        else:
+            return True
 
 
 def find_relationship_elements(rels_root: XmlElement) -> List[XmlElement]:
@@ -1,11 +1,27 @@
+import gc
 import io
 import io as std_io
 import logging
+import os
+import pickle
+import threading
+import tracemalloc
 import typing
 import zipfile
 from unittest import TestCase
 
+from pypdf import PdfWriter
+from pypdf.generic import (
+    DecodedStreamObject,
+    DictionaryObject,
+    NameObject,
+    NumberObject,
+    create_string_object,
+)
+
+import sharepoint2text
 from sharepoint2text.parsing.exceptions import (
+    ExtractionFailedError,
     ExtractionFileEncryptedError,
     ExtractionFileTooLargeError,
 )
@@ -38,6 +54,7 @@ from sharepoint2text.parsing.extractors.data_types import (
     OdtUnitMetadata,
     OpenDocumentAnnotation,
     PdfContent,
+    PdfImage,
     PdfUnitMetadata,
     PlainTextContent,
     PlainUnitMetadata,
@@ -80,11 +97,22 @@ from sharepoint2text.parsing.extractors.open_office.odp_extractor import read_od
 from sharepoint2text.parsing.extractors.open_office.ods_extractor import read_ods
 from sharepoint2text.parsing.extractors.open_office.odt_extractor import read_odt
 from sharepoint2text.parsing.extractors.pdf.pdf_extractor import (
+    _READER_CACHE_SIZE,
+    _decode_pdf_string,
     _get_pypdf_char_map_patcher,
+    _image_type_for_filters,
+    _open_document,
     _patched_build_char_map,
+    _resolve_page_workers,
+    iterate_pdf_pages,
     read_pdf,
+    read_pdf_path,
 )
 from sharepoint2text.parsing.extractors.plain_extractor import read_plain_text
+from sharepoint2text.parsing.extractors.util.sevenzip import (
+    Bad7zFile,
+    SevenZipReader,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -580,6 +608,44 @@ def test_read_pptx_3() -> None:
     )
 
 
+def test_read_pptx__slide_workers_match_sequential() -> None:
+    # Three slides, so the pool is not bypassed for short decks
+    path = "sharepoint2text/tests/resources/modern_ms/eu-visibility_rules_00704232-AF9F-1A18-BD782C469454ADAD_68401.pptx"
+    sequential: PptxContent = next(read_pptx(_read_file_to_file_like(path=path)))
+    parallel: PptxContent = next(
+        read_pptx(_read_file_to_file_like(path=path), slide_workers=2)
+    )
+
+    tc.assertEqual(3, len(parallel.slides))
+    tc.assertListEqual(sequential.slides, parallel.slides)
+
+    # The package-level wrapper forwards the option
+    public: PptxContent = next(
+        sharepoint2text.read_pptx(_read_file_to_file_like(path=path), slide_workers=2)
+    )
+    tc.assertListEqual(sequential.slides, public.slides)
+
+
+def test_read_pptx__repeated_image_shares_blob() -> None:
+    path = "sharepoint2text/tests/resources/modern_ms/pptx_formula_image.pptx"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(buffer, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "ppt/slides/slide1.xml":
+                start = data.index(b"<p:pic>")
+                end = data.index(b"</p:pic>") + len(b"</p:pic>")
+                data = data[:end] + data[start:end] + data[end:]
+            dst.writestr(item, data)
+    buffer.seek(0)
+
+    pptx: PptxContent = next(read_pptx(buffer))
+
+    images = pptx.slides[0].images
+    tc.assertEqual(2, len(images))
+    tc.assertIs(images[0].blob, images[1].blob)
+
+
 def test_read_docx_1() -> None:
     # An actual document from the web - this is likely created on a Windows client
     path = (
@@ -1558,6 +1624,13 @@ def test_password_protected__odp() -> None:
         list(read_odp(file_like=_read_file_to_file_like(path=path), path=path))
 
 
+def test_password_protected__odf() -> None:
+    # No encrypted formula fixture; the manifest check is shared across ODF types
+    path = "sharepoint2text/tests/resources/open_office/password_protected/odt-password-protected-pw123.odt"
+    with tc.assertRaises(ExtractionFileEncryptedError):
+        list(read_odf(file_like=_read_file_to_file_like(path=path), path=path))
+
+
 def test_password_protected__pdf() -> None:
     path = "sharepoint2text/tests/resources/legacy_ms/password_protected/pdf-password-protected-pw123.pdf"
     with tc.assertRaises(ExtractionFileEncryptedError):
@@ -1779,6 +1852,61 @@ def test_read_open_office__document_aoo() -> None:
     tc.assertEqual(1, len(list(odt.iterate_images())))
 
 
+def test_read_open_office__document_nested_table() -> None:
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<office:document-content"
+        ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+        ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0">'
+        "<office:body><office:text>"
+        "<table:table>"
+        "<table:table-header-rows><table:table-row>"
+        "<table:table-cell><text:p>Outer</text:p></table:table-cell>"
+        "</table:table-row></table:table-header-rows>"
+        "<table:table-row><table:table-cell>"
+        "<text:p>Before</text:p>"
+        "<table:table><table:table-row>"
+        "<table:table-cell><text:p>Inner</text:p></table:table-cell>"
+        "</table:table-row></table:table>"
+        "</table:table-cell></table:table-row>"
+        "</table:table>"
+        "</office:text></office:body></office:document-content>"
+    )
+    file_like = _zip_bytes_to_file_like(
+        {"mimetype": "application/vnd.oasis.opendocument.text", "content.xml": content}
+    )
+    odt: OdtContent = next(read_odt(file_like=file_like))
+
+    tc.assertListEqual(
+        [OdtTable(data=[["Outer"], ["Before"]]), OdtTable(data=[["Inner"]])],
+        odt.tables,
+    )
+    tc.assertEqual("Outer\nBefore\nInner", odt.get_full_text())
+
+
+def test_read_open_office__document_deeply_nested_spans() -> None:
+    depth = 3000
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<office:document-content"
+        ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+        "<office:body><office:text><text:p>Start "
+        + "<text:span>" * depth
+        + "deep"
+        + "</text:span>" * depth
+        + ' end<text:s text:c="2"/>tail</text:p>'
+        "</office:text></office:body></office:document-content>"
+    )
+    file_like = _zip_bytes_to_file_like(
+        {"mimetype": "application/vnd.oasis.opendocument.text", "content.xml": content}
+    )
+    odt: OdtContent = next(read_odt(file_like=file_like))
+
+    tc.assertEqual("Start deep end  tail", odt.get_full_text())
+
+
 def test_read_open_office__presentation_aoo() -> None:
     path = "sharepoint2text/tests/resources/open_office/apache_oo/aoo_presentation.odp"
     odp: OdpContent = next(
@@ -1861,6 +1989,116 @@ def test_read_open_office__drawing_odg() -> None:
     tc.assertEqual(1, len(list(odg.iterate_images())))
     tc.assertEqual(1, len(list(odg.iterate_units())))
 
+    # Image bytes are read from the archive on first access
+    image = odg.images[0]
+    tc.assertIsNotNone(image._data_loader)
+    data = image.get_bytes().read()
+    tc.assertEqual(image.size_bytes, len(data))
+    tc.assertTrue(data.startswith(b"\x89PNG"))
+    tc.assertIsNone(image._data_loader)
+    restored = pickle.loads(pickle.dumps(odg.images[0]))
+    tc.assertEqual(data, restored.get_bytes().read())
+
+    # Lazy loads do not depend on the caller's stream staying open or unchanged
+    raw = _read_file_to_file_like(path=path).getvalue()
+    with io.BytesIO(raw) as buffer:
+        closed_odg: OdgContent = next(read_odg(file_like=buffer))
+    tc.assertEqual(data, closed_odg.images[0].get_bytes().read())
+
+    buffer = io.BytesIO(raw)
+    reused_odg: OdgContent = next(read_odg(file_like=buffer))
+    buffer.seek(0)
+    buffer.truncate()
+    buffer.write(b"not a zip")
+    tc.assertEqual(data, reused_odg.images[0].get_bytes().read())
+
+    # Read failures are recorded on the image like an eager read would
+    corrupted = bytearray(raw)
+    corrupted[raw.index(data[:64]) + 100] ^= 0xFF
+    broken_odg: OdgContent = next(read_odg(file_like=io.BytesIO(bytes(corrupted))))
+    broken = broken_odg.images[0]
+    tc.assertIsNone(broken.data)
+    tc.assertIn("CRC", broken.error or "")
+
+
+def _odg_with_large_member(image: bytes, filler_size: int) -> io.BytesIO:
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<office:document-content"
+        ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0"'
+        ' xmlns:xlink="http://www.w3.org/1999/xlink">'
+        "<office:body><office:drawing><draw:page>"
+        '<draw:frame><draw:image xlink:href="Pictures/a.png"/></draw:frame>'
+        "</draw:page></office:drawing></office:body></office:document-content>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("content.xml", content)
+        zf.writestr("Pictures/a.png", image)
+        zf.writestr("unrelated.bin", os.urandom(filler_size), zipfile.ZIP_STORED)
+    buffer.seek(0)
+    return buffer
+
+
+def test_read_open_office__drawing_lazy_images_retain_only_their_member() -> None:
+    image = b"\x89PNG" + os.urandom(64 * 1024) + b"pixels" * 10_000
+    filler_size = 8 * 1024 * 1024
+
+    tracemalloc.start()
+    try:
+        odg: OdgContent = next(
+            read_odg(file_like=_odg_with_large_member(image, filler_size))
+        )
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # The caller's buffer is gone; unread images must not pin the archive
+    tc.assertLess(retained, filler_size // 4)
+    tc.assertEqual(image, odg.images[0].get_bytes().read())
+    tc.assertIsNone(odg.images[0].error)
+
+
+def test_read_open_office__drawing_nested_frames() -> None:
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        "<office:document-content"
+        ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+        ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"'
+        ' xmlns:draw="urn:oasis:names:tc:opendocument:xmlns:drawing:1.0"'
+        ' xmlns:xlink="http://www.w3.org/1999/xlink">'
+        "<office:automatic-styles><text:p>Style text</text:p></office:automatic-styles>"
+        "<office:body><office:drawing><draw:page>"
+        "<draw:frame><draw:text-box><text:p>Outer"
+        '<draw:frame draw:name="inner"><draw:image xlink:href="http://a/1.png"/>'
+        "</draw:frame></text:p></draw:text-box></draw:frame>"
+        '<draw:frame draw:name="second"><draw:image xlink:href="http://a/2.png"/>'
+        "</draw:frame>"
+        "<text:h>Heading</text:h><text:p>Last</text:p>"
+        "</draw:page></office:drawing></office:body></office:document-content>"
+    )
+    file_like = _zip_bytes_to_file_like(
+        {
+            "mimetype": "application/vnd.oasis.opendocument.graphics",
+            "content.xml": content,
+        }
+    )
+    odg: OdgContent = next(read_odg(file_like=file_like))
+
+    tc.assertEqual("Outer\nHeading\nLast", odg.get_full_text())
+    tc.assertListEqual(
+        [("inner", 1), ("second", 2)],
+        [(image.name, image.image_index) for image in odg.images],
+    )
+
+    file_like = _zip_bytes_to_file_like(
+        {"content.xml": content.replace("office:drawing", "office:spreadsheet")}
+    )
+    with tc.assertRaises(ExtractionFailedError):
+        next(read_odg(file_like=file_like))
+
 
 def test_read_open_office__formula_odf() -> None:
     path = "sharepoint2text/tests/resources/open_office/formular.odf"
@@ -2340,6 +2578,232 @@ def test_pdf__1() -> None:
     tc.assertEqual(PdfUnitMetadata(unit_number=1), units[0].get_metadata())
 
 
+def test_pdf__page_workers_match_sequential() -> None:
+    path = "sharepoint2text/tests/resources/pdf/sample.pdf"
+    # Four pages, so the pool is not bypassed for short documents
+    writer = PdfWriter()
+    for _ in range(2):
+        writer.append(path)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    pdf_bytes = buffer.getvalue()
+
+    sequential: PdfContent = next(read_pdf(file_like=io.BytesIO(pdf_bytes)))
+    parallel: PdfContent = next(
+        read_pdf(file_like=io.BytesIO(pdf_bytes), page_workers=2)
+    )
+
+    tc.assertEqual(4, len(parallel.pages))
+    tc.assertListEqual(
+        [page.text for page in sequential.pages],
+        [page.text for page in parallel.pages],
+    )
+    tc.assertListEqual(
+        [page.tables for page in sequential.pages],
+        [page.tables for page in parallel.pages],
+    )
+    tc.assertListEqual(
+        [[image.data for image in page.images] for page in sequential.pages],
+        [[image.data for image in page.images] for page in parallel.pages],
+    )
+
+
+def test_pdf__resolve_page_workers() -> None:
+    tc.assertEqual(1, _resolve_page_workers(8, 2))
+    tc.assertEqual(3, _resolve_page_workers(8, 3))
+    tc.assertEqual(2, _resolve_page_workers(2, 10))
+    tc.assertGreaterEqual(_resolve_page_workers(0, 100), 1)
+    tc.assertEqual(1, _resolve_page_workers(1, 100))
+
+
+def test_pdf__iterate_pages() -> None:
+    path = "sharepoint2text/tests/resources/pdf/sample.pdf"
+    pdf: PdfContent = next(
+        read_pdf(file_like=_read_file_to_file_like(path=path), path=path)
+    )
+    pages = list(iterate_pdf_pages(file_like=_read_file_to_file_like(path=path)))
+
+    tc.assertEqual(2, len(pages))
+    tc.assertListEqual([page.text for page in pdf.pages], [page.text for page in pages])
+    tc.assertListEqual(
+        [page.tables for page in pdf.pages], [page.tables for page in pages]
+    )
+    tc.assertListEqual(
+        [[image.data for image in page.images] for page in pdf.pages],
+        [[image.data for image in page.images] for page in pages],
+    )
+
+
+def test_pdf__extract_text_and_images_flags() -> None:
+    path = "sharepoint2text/tests/resources/pdf/multi_image.pdf"
+    full: PdfContent = next(
+        read_pdf(file_like=_read_file_to_file_like(path=path), path=path)
+    )
+    images_only: PdfContent = next(
+        read_pdf(
+            file_like=_read_file_to_file_like(path=path),
+            path=path,
+            extract_text=False,
+        )
+    )
+    text_only: PdfContent = next(
+        read_pdf(
+            file_like=_read_file_to_file_like(path=path),
+            path=path,
+            extract_images=False,
+        )
+    )
+
+    tc.assertGreater(len(full.pages[0].images), 0)
+    tc.assertEqual("", images_only.pages[0].text)
+    tc.assertListEqual([], images_only.pages[0].tables)
+    tc.assertListEqual(
+        [image.data for image in full.pages[0].images],
+        [image.data for image in images_only.pages[0].images],
+    )
+    tc.assertEqual(full.pages[0].text, text_only.pages[0].text)
+    tc.assertListEqual([], text_only.pages[0].images)
+
+
+def test_pdf__image_type_for_filter_chains() -> None:
+    tc.assertEqual(("jpeg", "image/jpeg"), _image_type_for_filters(("/DCTDecode",)))
+    # Transport filters are undone by pypdf before the image codec
+    tc.assertEqual(
+        ("jpeg", "image/jpeg"),
+        _image_type_for_filters(("/FlateDecode", "/DCTDecode")),
+    )
+    # An image codec followed by another filter decodes to unusable bytes
+    tc.assertEqual(
+        ("raw", "image/unknown"),
+        _image_type_for_filters(("/DCTDecode", "/FlateDecode")),
+    )
+    tc.assertEqual(("raw", "image/unknown"), _image_type_for_filters(("",)))
+    tc.assertEqual(("raw", "image/unknown"), _image_type_for_filters(()))
+
+
+def test_pdf__reader_reused_for_same_content() -> None:
+    path = "sharepoint2text/tests/resources/pdf/sample.pdf"
+    first, _, first_lock = _open_document(_read_file_to_file_like(path=path))
+    second, _, second_lock = _open_document(_read_file_to_file_like(path=path))
+    tc.assertIs(first, second)
+    tc.assertIs(first_lock, second_lock)
+
+    pdf: PdfContent = next(read_pdf(file_like=_read_file_to_file_like(path=path)))
+    again: PdfContent = next(read_pdf(file_like=_read_file_to_file_like(path=path)))
+    tc.assertListEqual(
+        [page.text for page in pdf.pages], [page.text for page in again.pages]
+    )
+
+    # The cache stays bounded: older documents are evicted
+    others = [
+        "multi_image.pdf",
+        "multi_table.pdf",
+        "large_table_1.pdf",
+        "two_tables_horizontal.pdf",
+        "wirecard-annual-report-2018-page190.pdf",
+    ]
+    tc.assertGreater(len(others), _READER_CACHE_SIZE)
+    for name in others:
+        other = f"sharepoint2text/tests/resources/pdf/{name}"
+        _open_document(_read_file_to_file_like(path=other))
+    third, _, _ = _open_document(_read_file_to_file_like(path=path))
+    tc.assertIsNot(first, third)
+
+
+def test_pdf__lazy_image_data_waits_for_shared_reader() -> None:
+    path = "sharepoint2text/tests/resources/pdf/multi_image.pdf"
+    pdf: PdfContent = next(read_pdf(file_like=_read_file_to_file_like(path=path)))
+    _, _, reader_lock = _open_document(_read_file_to_file_like(path=path))
+    image = pdf.pages[0].images[0]
+    tc.assertEqual("/FlateDecode", image.filter)
+
+    # Decoding resolves objects through the cached reader, so it must wait
+    # while another thread holds the reader's lock
+    loaded: list[bytes] = []
+    with reader_lock:
+        worker = threading.Thread(target=lambda: loaded.append(image.data))
+        worker.start()
+        worker.join(timeout=0.2)
+        tc.assertTrue(worker.is_alive())
+    worker.join()
+    tc.assertTrue(loaded[0])
+
+
+def test_pdf__image_data_is_loaded_lazily() -> None:
+    calls: list[int] = []
+
+    def loader() -> bytes:
+        calls.append(1)
+        return b"\x89PNG"
+
+    image = PdfImage(index=1)
+    image.set_data_loader(loader)
+    tc.assertListEqual([], calls)
+    tc.assertEqual(b"\x89PNG", image.data)
+    tc.assertEqual(b"\x89PNG", image.get_bytes().read())
+    tc.assertEqual(1, len(calls))
+
+    # Pickling (e.g. from page pool workers) carries the decoded bytes
+    pending = PdfImage()
+    pending.set_data_loader(loader)
+    restored = pickle.loads(pickle.dumps(pending))
+    tc.assertEqual(b"\x89PNG", restored.data)
+
+    image.data = b"replaced"
+    tc.assertEqual(b"replaced", image.data)
+
+
+def test_pdf__repeated_image_draws_share_one_decode() -> None:
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=100, height=100)
+    image = DecodedStreamObject()
+    image.set_data(b"\x00\xff\x00" * 4)
+    image.update(
+        {
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Image"),
+            NameObject("/Width"): NumberObject(2),
+            NameObject("/Height"): NumberObject(2),
+            NameObject("/ColorSpace"): NameObject("/DeviceRGB"),
+            NameObject("/BitsPerComponent"): NumberObject(8),
+        }
+    )
+    image_ref = writer._add_object(image.flate_encode())
+    page[NameObject("/Resources")] = DictionaryObject(
+        {NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): image_ref})}
+    )
+    content = DecodedStreamObject()
+    content.set_data(b"q 10 0 0 10 0 0 cm /Im0 Do Q q 10 0 0 10 50 50 cm /Im0 Do Q")
+    page[NameObject("/Contents")] = writer._add_object(content)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    buffer.seek(0)
+
+    pdf: PdfContent = next(read_pdf(file_like=buffer))
+    images = pdf.pages[0].images
+
+    tc.assertEqual(2, len(images))
+    tc.assertEqual(b"\x00\xff\x00" * 4, images[0].data)
+    tc.assertIs(images[0].data, images[1].data)
+
+
+def test_pdf__read_pdf_path_matches_read_pdf() -> None:
+    path = "sharepoint2text/tests/resources/pdf/multi_image.pdf"
+    expected: PdfContent = next(
+        read_pdf(file_like=_read_file_to_file_like(path=path), path=path)
+    )
+    mapped: PdfContent = next(read_pdf_path(path))
+
+    tc.assertEqual(expected.metadata.filename, mapped.metadata.filename)
+    tc.assertListEqual(
+        [page.text for page in expected.pages], [page.text for page in mapped.pages]
+    )
+    tc.assertListEqual(
+        [[image.data for image in page.images] for page in expected.pages],
+        [[image.data for image in page.images] for page in mapped.pages],
+    )
+
+
 def test_pdf__2() -> None:
     path = "sharepoint2text/tests/resources/pdf/multi_image.pdf"
     pdf: PdfContent = next(
@@ -2766,6 +3230,24 @@ def test_pdf__pypdf_patched_build_char_map_context_manager() -> None:
         tc.assertIs(current, original)
 
 
+def test_pdf__decode_pdf_string_matches_pypdf() -> None:
+    """The fast string decoder must agree with pypdf's create_string_object."""
+    samples = [
+        b"Caption",
+        b"\x95 bullet \x84",  # PDFDocEncoding-specific code points
+        b"\xfe\xff\x00H\x00i",  # UTF-16BE with BOM
+        b"\xff\xfeH\x00i\x00",  # UTF-16LE with BOM
+        b"\x00H\x00i",  # UTF-16BE without BOM
+        b"caf\xc3\xa9\x7f",  # undefined PDFDocEncoding byte -> UTF-8 fallback
+        b"",
+    ]
+    for raw in samples:
+        expected = create_string_object(raw)
+        if isinstance(expected, bytes):
+            expected = expected.decode("utf-8", errors="ignore")
+        tc.assertEqual(str(expected), _decode_pdf_string(raw))
+
+
 def test_read_html__1() -> None:
     path = "sharepoint2text/tests/resources/html/sample.html"
     html: HtmlContent = next(
@@ -3240,6 +3722,57 @@ def test_7zip_file_size_limit() -> None:
         archive_module.MAX_7Z_FILE_SIZE = original_max_7z_file_size
 
 
+def test_7zip_reader__start_header_checks() -> None:
+    path = "sharepoint2text/tests/resources/archives/test_archive.7z"
+    data = _read_file_to_file_like(path=path).getvalue()
+    tc.assertEqual(4, len(SevenZipReader(io.BytesIO(data)).list()))
+
+    corrupted = bytearray(data)
+    corrupted[20] ^= 0xFF
+    with tc.assertRaisesRegex(Bad7zFile, "Start header CRC mismatch"):
+        SevenZipReader(io.BytesIO(bytes(corrupted)))
+
+    with tc.assertRaisesRegex(Bad7zFile, "Unexpected end of file"):
+        SevenZipReader(io.BytesIO(data[:20]))
+
+    with tc.assertRaisesRegex(Bad7zFile, "Invalid 7z signature"):
+        SevenZipReader(io.BytesIO(b"PK" + data[2:]))
+
+
+def test_read_7zip_archive__decompresses_in_chunks() -> None:
+    import sharepoint2text.parsing.extractors.util.sevenzip as sevenzip_module
+
+    path = "sharepoint2text/tests/resources/archives/test_archive.7z"
+    expected = [
+        r.get_full_text()
+        for r in read_archive(file_like=_read_file_to_file_like(path=path), path=path)
+    ]
+
+    original_chunk_size = sevenzip_module._CHUNK_SIZE
+    sevenzip_module._CHUNK_SIZE = 7
+    try:
+        results = list(
+            read_archive(file_like=_read_file_to_file_like(path=path), path=path)
+        )
+    finally:
+        sevenzip_module._CHUNK_SIZE = original_chunk_size
+
+    tc.assertListEqual(expected, [r.get_full_text() for r in results])
+
+
+def test_read_7zip_archive__non_bmp_file_names() -> None:
+    path = "sharepoint2text/tests/resources/archives/non_bmp_names.7z"
+    results = list(
+        read_archive(file_like=_read_file_to_file_like(path=path), path=path)
+    )
+
+    tc.assertEqual(1, len(results))
+    tc.assertEqual("clef_\U0001d11e.txt", results[0].get_metadata().filename)
+    tc.assertEqual(
+        "A file with a musical symbol in its name", results[0].get_full_text()
+    )
+
+
 def test_read_tar_gz_archive() -> None:
     """Test compressed TAR.GZ archive extraction."""
     path = "sharepoint2text/tests/resources/archives/test_archive.tar.gz"
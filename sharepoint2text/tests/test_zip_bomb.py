@@ -1,13 +1,19 @@
 import io
 import zipfile
+from xml.etree.ElementTree import ParseError
 
 import pytest
+from defusedxml import EntitiesForbidden
 
 from sharepoint2text.parsing.exceptions import ExtractionZipBombError
 from sharepoint2text.parsing.extractors.util.zip_bomb import (
     ZipBombLimits,
     validate_zip_bytesio,
 )
+from sharepoint2text.parsing.extractors.util.zip_utils import (
+    iterparse_zip_xml,
+    read_zip_xml_root,
+)
 
 
 def _make_zip_bytesio(files: dict[str, bytes]) -> io.BytesIO:
@@ -57,3 +63,77 @@ def test_zip_bomb_detection_can_use_low_thresholds__entry_count() -> None:
             limits=ZipBombLimits(max_entries=2),
             source="test",
         )
+
+
+def test_zip_xml_parsing_rejects_entity_declarations() -> None:
+    laughs = (
+        b'<?xml version="1.0"?>'
+        b'<!DOCTYPE a [<!ENTITY x "lol"><!ENTITY y "&x;&x;&x;">]><a>&y;</a>'
+    )
+    buffer = _make_zip_bytesio(
+        {
+            "plain.xml": b'<?xml version="1.0" encoding="UTF-8"?><a><b>text</b></a>',
+            "entities.xml": laughs,
+            "entities_utf16.xml": laughs.decode().encode("utf-16"),
+        }
+    )
+
+    with zipfile.ZipFile(buffer) as zf:
+        root = read_zip_xml_root(zf, "plain.xml")
+        assert root.find("b").text == "text"
+        for name in ("entities.xml", "entities_utf16.xml"):
+            with pytest.raises(EntitiesForbidden):
+                read_zip_xml_root(zf, name)
+
+
+def test_zip_xml_iterparse_streams_and_rejects_entity_declarations() -> None:
+    laughs = (
+        b'<?xml version="1.0"?>'
+        b'<!DOCTYPE a [<!ENTITY x "lol"><!ENTITY y "&x;&x;&x;">]><a>&y;</a>'
+    )
+    large = (
+        b'<?xml version="1.0" encoding="UTF-8"?><a>' + b"<b>t</b>" * 20_000 + b"</a>"
+    )
+    buffer = _make_zip_bytesio(
+        {
+            "large.xml": large,
+            "entities.xml": laughs,
+            # a root-like tag inside a comment must not end the prolog scan
+            "commented.xml": b"<!-- <a> -->" + laughs[len(b'<?xml version="1.0"?>') :],
+            "entities_utf16.xml": laughs.decode().encode("utf-16"),
+        }
+    )
+
+    with zipfile.ZipFile(buffer) as zf:
+        ends = [el.tag for _, el in iterparse_zip_xml(zf, "large.xml", ("end",))]
+        assert ends.count("b") == 20_000
+        assert ends[-1] == "a"
+        for name in ("entities.xml", "commented.xml", "entities_utf16.xml"):
+            with pytest.raises(EntitiesForbidden):
+                list(iterparse_zip_xml(zf, name, ("end",)))
+
+
+def test_zip_xml_iterparse_closes_member_streams(monkeypatch) -> None:
+    buffer = _make_zip_bytesio(
+        {"a.xml": b"<a>" + b"<b/>" * 100 + b"</a>", "broken.xml": b"<a><b></a>"}
+    )
+    opened = []
+    original_open = zipfile.ZipFile.open
+
+    def recording_open(self, *args, **kwargs):
+        stream = original_open(self, *args, **kwargs)
+        opened.append(stream)
+        return stream
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", recording_open)
+    with zipfile.ZipFile(buffer) as zf:
+        abandoned = iterparse_zip_xml(zf, "a.xml", ("end",))
+        next(abandoned)
+        abandoned.close()
+        with pytest.raises(ParseError):
+            list(iterparse_zip_xml(zf, "broken.xml", ("end",)))
+        # Nothing is opened until the parse is iterated
+        iterparse_zip_xml(zf, "a.xml", ("end",))
+
+        assert len(opened) == 2
+        assert all(stream.closed for stream in opened)